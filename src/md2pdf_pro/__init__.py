@@ -1,10 +1,13 @@
 """MD2PDF Pro - Batch Markdown to PDF Converter."""
 
+from __future__ import annotations
+
 __version__ = "1.3.1"
 __author__ = "Guoqin Chen"
 
-from md2pdf_pro.config import ProjectConfig
-from md2pdf_pro.converter import PandocEngine
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from md2pdf_pro.errors import (
     BatchError,
     CLIError,
@@ -19,8 +22,21 @@ from md2pdf_pro.errors import (
     format_error,
     handle_error,
 )
-from md2pdf_pro.parallel import BatchProcessor
-from md2pdf_pro.preprocessor import MermaidPreprocessor
+
+if TYPE_CHECKING:
+    from md2pdf_pro.config import ProjectConfig
+    from md2pdf_pro.converter import PandocEngine
+    from md2pdf_pro.parallel import BatchProcessor
+    from md2pdf_pro.preprocessor import MermaidPreprocessor
+
+# Heavy submodules (pydantic models, rich, subprocess wrappers) are only
+# imported when the corresponding name is first accessed (PEP 562).
+_LAZY_IMPORTS = {
+    "ProjectConfig": "md2pdf_pro.config",
+    "PandocEngine": "md2pdf_pro.converter",
+    "BatchProcessor": "md2pdf_pro.parallel",
+    "MermaidPreprocessor": "md2pdf_pro.preprocessor",
+}
 
 __all__ = [
     "ProjectConfig",
@@ -40,3 +56,19 @@ __all__ = [
     "handle_error",
     "format_error",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import heavy public names on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily imported names in dir()."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
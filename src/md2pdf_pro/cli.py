@@ -5,10 +5,15 @@ This module provides the CLI interface using Typer with Rich formatting.
 
 from __future__ import annotations
 
-import asyncio
+import fnmatch
 import logging
+import os
+import re
+import sys
+from collections.abc import Callable, Coroutine, Iterator
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import typer
 from rich.console import Console
@@ -18,15 +23,14 @@ from md2pdf_pro import __version__
 from md2pdf_pro.config import (
     PdfCompression,
     ProjectConfig,
+    RuntimeConfig,
     get_default_config_path,
 )
-from md2pdf_pro.converter import PandocEngine, check_dependencies, optimize_pdf
-from md2pdf_pro.parallel import BatchProcessor
-from md2pdf_pro.preprocessor import MermaidPreprocessor
-from md2pdf_pro.templates import get_chinese_journal_params
+from md2pdf_pro.errors import ConfigError, ErrorCode
 
-# Initialize console
-console = Console()
+if TYPE_CHECKING:
+    from md2pdf_pro.converter import PandocEngine
+    from md2pdf_pro.preprocessor import MermaidPreprocessor
 
 # Create Typer app
 app = typer.Typer(
@@ -35,18 +39,21 @@ app = typer.Typer(
     add_completion=False,
 )
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="[%(levelname)s] %(message)s",
-)
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+@cache
+def _console() -> Console:
+    """Return the shared Rich console, creating it on first use."""
+    return Console()
+
 
 def version_callback(value: bool) -> None:
     """Print version and exit."""
     if value:
-        console.print(f"MD2PDF Pro v{__version__}")
+        print(f"MD2PDF Pro v{__version__}")
         raise typer.Exit()
 
 
@@ -60,6 +67,10 @@ def main(
     ),
 ) -> None:
     """MD2PDF Pro - Batch Markdown to PDF Converter."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="[%(levelname)s] %(message)s",
+    )
     if verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
@@ -144,6 +155,9 @@ def convert(
     ),
 ) -> None:
     """Convert a Markdown file to PDF."""
+    from md2pdf_pro.converter import optimize_pdf
+    from md2pdf_pro.templates import get_chinese_journal_params
+
     # Load configuration
     project_config = _load_config(config)
 
@@ -160,6 +174,8 @@ def convert(
         journal_year=journal_year,
     )
 
+    pandoc_overrides: dict[str, Any] = {}
+
     # Apply journal template if specified
     if journal_title:
         # Get chinese_journal template if not already using custom template
@@ -168,25 +184,40 @@ def convert(
 
             journal_template = get_template("chinese_journal")
             if journal_template:
-                project_config.pandoc.template = journal_template
+                pandoc_overrides["template"] = journal_template
 
-        project_config.pandoc.template_vars.update(journal_params)
+        pandoc_overrides["template_vars"] = {
+            **project_config.pandoc.template_vars,
+            **journal_params,
+        }
 
     # Override with CLI arguments
     if template:
-        project_config.pandoc.template = template
-    project_config.processing.max_workers = workers
+        pandoc_overrides["template"] = template
 
     # PDF optimization settings
-    project_config.pdf.compression = compression
+    metadata_overrides: dict[str, Any] = {}
     if author:
-        project_config.pdf.metadata.author = author
+        metadata_overrides["author"] = author
     if title:
-        project_config.pdf.metadata.title = title
+        metadata_overrides["title"] = title
+    watermark_overrides: dict[str, Any] = {}
     if watermark:
-        project_config.pdf.watermark.enabled = True
+        watermark_overrides["enabled"] = True
     if watermark_text:
-        project_config.pdf.watermark.text = watermark_text
+        watermark_overrides["text"] = watermark_text
+
+    project_config = project_config.with_overrides(
+        {
+            "pandoc": pandoc_overrides,
+            "processing": {"max_workers": workers},
+            "pdf": {
+                "compression": compression,
+                "metadata": metadata_overrides,
+                "watermark": watermark_overrides,
+            },
+        }
+    )
 
     # Set output path
     # 逻辑：如果未指定输出文件，则使用输入文件名（后缀改为.pdf）
@@ -201,11 +232,11 @@ def convert(
         # Ensure output has .pdf extension
         output = output.with_suffix(".pdf")
 
-    console.print(f"[cyan]Converting:[/cyan] {input_file.name}")
+    _console().print(f"[cyan]Converting:[/cyan] {input_file.name}")
 
     # Run conversion
     try:
-        asyncio.run(_convert_single(input_file, output, project_config))
+        _run(_convert_single(input_file, output, project_config.to_runtime()))
 
         # Apply PDF optimization if enabled
         if project_config.output.optimize_pdf:
@@ -222,9 +253,9 @@ def convert(
                 # Replace original with optimized
                 optimized_output.replace(temp_output)
 
-        console.print(f"[green]✓[/green] PDF generated: {output}")
+        _console().print(f"[green]✓[/green] PDF generated: {output}")
     except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
+        _console().print(f"[red]Error:[/red] {e}")
         raise typer.Exit(code=1)
 
 
@@ -251,39 +282,53 @@ def batch(
     dry_run: bool = typer.Option(
         False, "--dry-run", help="Show what would be processed"
     ),
+    book: Path | None = typer.Option(
+        None, "--book", help="Combine all files into this single PDF"
+    ),
 ) -> None:
     """Convert multiple Markdown files to PDF."""
-    # Load configuration
-    project_config = _load_config(config)
-
-    # Override with CLI arguments
-    project_config.output.output_dir = output_dir
-    project_config.processing.max_workers = workers
+    # Load configuration and override with CLI arguments
+    project_config = _load_config(config).with_overrides(
+        {
+            "output": {"output_dir": output_dir},
+            "processing": {"max_workers": workers},
+        }
+    )
 
     # Find files
     files = _find_files(input_pattern, recursive, ignore)
 
     if not files:
-        console.print("[yellow]No files found matching pattern[/yellow]")
+        _console().print("[yellow]No files found matching pattern[/yellow]")
         raise typer.Exit()
 
     # Show files to process
-    console.print(f"[cyan]Found {len(files)} file(s)[/cyan]")
+    _console().print(f"[cyan]Found {len(files)} file(s)[/cyan]")
 
     if dry_run:
         for f in files:
-            console.print(f"  - {f}")
+            _console().print(f"  - {f}")
         raise typer.Exit()
 
+    if book is not None:
+        # One pandoc run for the whole book instead of one per file
+        try:
+            _run(_convert_book(files, book, project_config.to_runtime()))
+        except Exception as e:
+            _console().print(f"[red]Error:[/red] {e}")
+            raise typer.Exit(code=1)
+        _console().print(f"[green]✓[/green] PDF generated: {book}")
+        return
+
     # Ensure output directory exists
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Run batch conversion
     try:
-        results = asyncio.run(_convert_batch(files, project_config))
+        results = _run(_convert_batch(files, project_config.to_runtime()))
         _print_batch_results(results)
     except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
+        _console().print(f"[red]Error:[/red] {e}")
         raise typer.Exit(code=1)
 
 
@@ -304,23 +349,28 @@ def watch(
     ),
 ) -> None:
     """Watch directory for changes and convert automatically."""
-    # Load configuration
-    project_config = ProjectConfig()
-
-    # Override with CLI arguments
-    project_config.output.output_dir = output_dir
-    project_config.processing.max_workers = workers
+    # Load configuration and override with CLI arguments
+    project_config = ProjectConfig().with_overrides(
+        {
+            "output": {"output_dir": output_dir},
+            "processing": {"max_workers": workers},
+        }
+    )
 
-    console.print(f"[cyan]Watching:[/cyan] {directory}")
-    console.print(f"[cyan]Output:[/cyan] {output_dir}")
-    console.print("[yellow]Press Ctrl+C to stop[/yellow]")
+    _console().print(f"[cyan]Watching:[/cyan] {directory}")
+    _console().print(f"[cyan]Output:[/cyan] {output_dir}")
+    _console().print("[yellow]Press Ctrl+C to stop[/yellow]")
 
     try:
-        asyncio.run(_watch_and_convert(directory, project_config, recursive, debounce))
+        _run(
+            _watch_and_convert(
+                directory, project_config.to_runtime(), recursive, debounce
+            )
+        )
     except KeyboardInterrupt:
-        console.print("\n[green]Stopped watching[/green]")
+        _console().print("\n[green]Stopped watching[/green]")
     except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
+        _console().print(f"[red]Error:[/red] {e}")
         raise typer.Exit(code=1)
 
 
@@ -335,14 +385,14 @@ def init(
 ) -> None:
     """Initialize configuration file."""
     if path.exists() and not force:
-        console.print(f"[yellow]Config already exists: {path}[/yellow]")
-        console.print("Use --force to overwrite")
+        _console().print(f"[yellow]Config already exists: {path}[/yellow]")
+        _console().print("Use --force to overwrite")
         raise typer.Exit()
 
     config = ProjectConfig()
     config.to_yaml(path)
 
-    console.print(f"[green]✓[/green] Config created: {path}")
+    _console().print(f"[green]✓[/green] Config created: {path}")
 
 
 @app.command()
@@ -354,19 +404,23 @@ def config_show(
     """Show current configuration."""
     project_config = _load_config(config)
 
+    rows = [
+        ("PDF Engine", project_config.pandoc.pdf_engine.value),
+        ("Max Workers", str(project_config.processing.max_workers)),
+        ("Output Dir", str(project_config.output.output_dir)),
+        ("Temp Dir", str(project_config.output.temp_dir)),
+        ("Mermaid Theme", project_config.mermaid.theme.value),
+        ("Log Level", project_config.logging.level.value),
+    ]
+
     # Display configuration
     table = Table(title="MD2PDF Configuration")
     table.add_column("Setting", style="cyan")
     table.add_column("Value", style="green")
+    for row in rows:
+        table.add_row(*row)
 
-    table.add_row("PDF Engine", project_config.pandoc.pdf_engine.value)
-    table.add_row("Max Workers", str(project_config.processing.max_workers))
-    table.add_row("Output Dir", str(project_config.output.output_dir))
-    table.add_row("Temp Dir", str(project_config.output.temp_dir))
-    table.add_row("Mermaid Theme", project_config.mermaid.theme.value)
-    table.add_row("Log Level", project_config.logging.level.value)
-
-    console.print(table)
+    _console().print(table)
 
 
 @app.command()
@@ -375,39 +429,44 @@ def doctor(
     fix: bool = typer.Option(False, "--fix", help="Attempt to fix issues"),
 ) -> None:
     """Check system dependencies and environment."""
-    console.print("[cyan]Checking dependencies...[/cyan]\n")
+    import platform
+
+    from md2pdf_pro.converter import check_dependencies
+
+    _console().print("[cyan]Checking dependencies...[/cyan]\n")
 
     # Check Python version
-    import platform
 
     python_version = platform.python_version()
-    console.print(f"[cyan]Python:[/cyan] {python_version}")
+    _console().print(f"[cyan]Python:[/cyan] {python_version}")
 
     # Check dependencies
     deps = check_dependencies()
+    rows = [
+        (name, "[green]✓ Installed[/green]" if available else "[red]✗ Not found[/red]")
+        for name, available in deps.items()
+    ]
 
     table = Table()
     table.add_column("Dependency", style="cyan")
     table.add_column("Status", style="green")
+    for row in rows:
+        table.add_row(*row)
 
-    for name, available in deps.items():
-        status = "[green]✓ Installed[/green]" if available else "[red]✗ Not found[/red]"
-        table.add_row(name, status)
-
-    console.print(table)
+    _console().print(table)
 
     # Summary
     all_installed = all(deps.values())
     if all_installed:
-        console.print("\n[green]✓ All dependencies installed[/green]")
+        _console().print("\n[green]✓ All dependencies installed[/green]")
     else:
-        console.print("\n[red]✗ Some dependencies missing[/red]")
-        console.print("[yellow]Install with:[/yellow]")
-        console.print("  brew install pandoc tectonic graphviz librsvg node")
-        console.print("  npm install -g @mermaid-js/mermaid-cli")
+        _console().print("\n[red]✗ Some dependencies missing[/red]")
+        _console().print("[yellow]Install with:[/yellow]")
+        _console().print("  brew install pandoc tectonic graphviz librsvg node")
+        _console().print("  npm install -g @mermaid-js/mermaid-cli")
 
     if fix:
-        console.print(
+        _console().print(
             "\n[yellow]Auto-fix not implemented. Please install dependencies manually.[/yellow]"
         )
 
@@ -428,7 +487,7 @@ def list_templates_cmd() -> None:
     templates = list_templates()
 
     if not templates:
-        console.print("[yellow]No templates found[/yellow]")
+        _console().print("[yellow]No templates found[/yellow]")
         return
 
     table = Table(title="Available Templates")
@@ -444,8 +503,8 @@ def list_templates_cmd() -> None:
             t.description,
         )
 
-    console.print(table)
-    console.print(f"\n[dim]User templates: {USER_TEMPLATE_DIR}[/dim]")
+    _console().print(table)
+    _console().print(f"\n[dim]User templates: {USER_TEMPLATE_DIR}[/dim]")
 
 
 @templates_app.command("path")
@@ -455,9 +514,9 @@ def template_path_cmd(name: str) -> None:
 
     path = get_template(name)
     if path:
-        console.print(f"[green]Template '{name}' found at:[/green]\n{path}")
+        _console().print(f"[green]Template '{name}' found at:[/green]\n{path}")
     else:
-        console.print(f"[red]Template '{name}' not found[/red]")
+        _console().print(f"[red]Template '{name}' not found[/red]")
         raise typer.Exit(code=1)
 
 
@@ -475,7 +534,7 @@ def init_template_cmd(
     # Check if template exists
     source_path = get_template(name)
     if not source_path:
-        console.print(f"[red]Template '{name}' not found[/red]")
+        _console().print(f"[red]Template '{name}' not found[/red]")
         raise typer.Exit(code=1)
 
     # Ensure user template dir exists
@@ -483,15 +542,15 @@ def init_template_cmd(
     dest_path = user_dir / f"{name}.latex"
 
     if dest_path.exists() and not force:
-        console.print(f"[yellow]Template already exists: {dest_path}[/yellow]")
-        console.print("Use --force to overwrite")
+        _console().print(f"[yellow]Template already exists: {dest_path}[/yellow]")
+        _console().print("Use --force to overwrite")
         raise typer.Exit(code=1)
 
     # Copy template
     import shutil
 
     shutil.copy(source_path, dest_path)
-    console.print(f"[green]Template copied to:[/green] {dest_path}")
+    _console().print(f"[green]Template copied to:[/green] {dest_path}")
 
 
 # Plugins command group
@@ -514,7 +573,7 @@ def list_plugins_cmd() -> None:
     plugins = manager.list_plugins()
 
     if not plugins:
-        console.print("[yellow]No plugins found[/yellow]")
+        _console().print("[yellow]No plugins found[/yellow]")
         return
 
     table = Table(title="Available Plugins")
@@ -536,7 +595,7 @@ def list_plugins_cmd() -> None:
             status,
         )
 
-    console.print(table)
+    _console().print(table)
 
 
 @plugins_app.command("enable")
@@ -551,11 +610,11 @@ def enable_plugin_cmd(name: str) -> None:
     manager = get_plugin_manager()
 
     if name not in manager._plugins:
-        console.print(f"[red]Plugin '{name}' not found[/red]")
+        _console().print(f"[red]Plugin '{name}' not found[/red]")
         raise typer.Exit(code=1)
 
     manager.enable(name)
-    console.print(f"[green]Plugin '{name}' enabled[/green]")
+    _console().print(f"[green]Plugin '{name}' enabled[/green]")
 
 
 @plugins_app.command("disable")
@@ -570,147 +629,374 @@ def disable_plugin_cmd(name: str) -> None:
     manager = get_plugin_manager()
 
     if name not in manager._plugins:
-        console.print(f"[red]Plugin '{name}' not found[/red]")
+        _console().print(f"[red]Plugin '{name}' not found[/red]")
         raise typer.Exit(code=1)
 
     manager.disable(name)
-    console.print(f"[yellow]Plugin '{name}' disabled[/yellow]")
+    _console().print(f"[yellow]Plugin '{name}' disabled[/yellow]")
+
+
+def _run(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on a fresh event loop."""
+    import asyncio
+
+    with asyncio.Runner(loop_factory=_event_loop_factory()) as runner:
+        return runner.run(coro)
+
+
+@lru_cache(maxsize=1)
+def _event_loop_factory() -> Callable[[], Any] | None:
+    """Get the uvloop loop factory if available, else None for the default."""
+    if sys.platform == "win32":
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
 
 
 def _load_config(config_path: Path | None) -> ProjectConfig:
     """Load project configuration."""
-    if config_path and config_path.exists():
-        return ProjectConfig.from_yaml(config_path)
+    if config_path:
+        project_config = _load_config_file(config_path)
+        if project_config is not None:
+            return project_config
 
     # Try default config
-    default_path = get_default_config_path()
-    if default_path.exists():
-        return ProjectConfig.from_yaml(default_path)
+    project_config = _load_config_file(get_default_config_path())
+    if project_config is not None:
+        return project_config
 
     # Use defaults
     return ProjectConfig()
 
 
+def _load_config_file(path: Path) -> ProjectConfig | None:
+    """Load a config file, returning None if it does not exist."""
+    try:
+        return ProjectConfig.from_yaml(path)
+    except ConfigError as e:
+        if e.error_code is ErrorCode.CONFIG_NOT_FOUND:
+            return None
+        raise
+
+
+# File discovery defaults
+_MARKDOWN_SUFFIXES = frozenset({".md", ".markdown"})
+_DEFAULT_IGNORE = (".*", "_*")
+
+
 def _find_files(pattern: str, recursive: bool, ignore: list[str] | None) -> list[Path]:
     """Find files matching pattern."""
-    base_path = Path(".")
+    base_path = "."
     search_pattern = pattern
 
     # Handle glob patterns
     if "/" in pattern:
         parts = pattern.rsplit("/", 1)
-        base_path = Path(parts[0])
+        base_path = parts[0]
         search_pattern = parts[1]
 
+    name_re = _compile_pattern(search_pattern)
+    prefix_re, substring_re = _compile_ignore(tuple(ignore or _DEFAULT_IGNORE))
+
     files = []
-    if recursive:
-        for f in base_path.rglob(search_pattern):
-            if f.is_file() and _should_process(f, ignore):
-                files.append(f)
-    else:
-        for f in base_path.glob(search_pattern):
-            if f.is_file() and _should_process(f, ignore):
-                files.append(f)
+    seen: set[tuple[int, int]] = set()
+    devices: dict[str, int] = {}
+    for entry in _iter_entries(base_path, recursive, substring_re):
+        name = entry.name
+        # Cheap name-only checks first; DirEntry.is_file() reuses readdir data
+        if os.path.splitext(name)[1].lower() not in _MARKDOWN_SUFFIXES:
+            continue
+        if not name_re.match(name) or prefix_re.match(name):
+            continue
+        if not entry.is_file():
+            continue
+        path = Path(entry.path)
+        if substring_re.search(str(path)):
+            continue
+        # Symlinks and hardlinks can reach the same file twice; key on the
+        # target's (device, inode) so each file is converted only once. Only
+        # symlinks need their target stat'ed; other entries take the inode
+        # from readdir data and the device from their directory
+        if entry.is_symlink():
+            st = entry.stat()
+            file_key = (st.st_dev, st.st_ino)
+        else:
+            parent = os.path.dirname(entry.path)
+            device = devices.get(parent)
+            if device is None:
+                device = devices[parent] = os.stat(parent).st_dev
+            file_key = (device, entry.inode())
+        if file_key in seen:
+            continue
+        seen.add(file_key)
+        files.append(path)
 
     return sorted(files)
 
 
+def _iter_entries(
+    base: str,
+    recursive: bool,
+    substring_re: re.Pattern[str],
+) -> Iterator[os.DirEntry[str]]:
+    """Yield non-directory entries under base, skipping ignored directories.
+
+    A directory whose path contains an ignore pattern is pruned before
+    descending, since every file below it would be excluded anyway. Name
+    prefixes only apply to files, so e.g. ``_posts/`` is still searched.
+    """
+    stack = [base]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if not entry.is_dir(follow_symlinks=False):
+                        yield entry
+                    elif recursive and not substring_re.search(
+                        os.path.normpath(entry.path)
+                    ):
+                        stack.append(entry.path)
+        except OSError:
+            # Unreadable or missing directory, same as Path.glob
+            continue
+
+
+@lru_cache(maxsize=128)
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a glob pattern into a regex matching file names."""
+    # Match Path.glob: case-insensitive only where the filesystem is
+    flags = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+    return re.compile(fnmatch.translate(pattern), flags)
+
+
+@lru_cache(maxsize=32)
+def _compile_ignore(
+    patterns: tuple[str, ...],
+) -> tuple[re.Pattern[str], re.Pattern[str]]:
+    """Compile ignore patterns into (name prefix, path substring) matchers."""
+    prefixes = "|".join(re.escape(p.replace("*", "")) for p in patterns)
+    substrings = "|".join(re.escape(p) for p in patterns)
+    return re.compile(prefixes), re.compile(substrings)
+
+
 def _should_process(file: Path, ignore: list[str] | None) -> bool:
     """Check if file should be processed."""
-    ignore_patterns = ignore or [".*", "_*"]
+    prefix_re, substring_re = _compile_ignore(tuple(ignore or _DEFAULT_IGNORE))
 
-    for pattern in ignore_patterns:
-        if file.name.startswith(pattern.replace("*", "")):
-            return False
-        if pattern in str(file):
-            return False
+    if prefix_re.match(file.name) or substring_re.search(str(file)):
+        return False
 
-    return file.suffix.lower() in (".md", ".markdown")
+    return file.suffix.lower() in _MARKDOWN_SUFFIXES
 
 
 async def _convert_single(
-    input_file: Path, output_file: Path, config: ProjectConfig
+    input_file: Path,
+    output_file: Path,
+    config: RuntimeConfig,
+    mermaid: MermaidPreprocessor | None = None,
+    engine: PandocEngine | None = None,
 ) -> None:
-    """Convert single file."""
+    """Convert single file.
+
+    Long-running callers (e.g. watch mode) pass in shared ``mermaid`` and
+    ``engine`` instances; missing ones are created for this call only.
+    """
     # Initialize components
-    mermaid = MermaidPreprocessor(config.mermaid)
-    engine = PandocEngine(config.pandoc, config.font)
+    if mermaid is None:
+        from md2pdf_pro.preprocessor import MermaidPreprocessor
+
+        mermaid = MermaidPreprocessor(config.mermaid)
+    if engine is None:
+        from md2pdf_pro.converter import PandocEngine
+
+        engine = PandocEngine(config.pandoc, config.font)
+    config.output.temp_dir.mkdir(parents=True, exist_ok=True)
+
+    await _convert_one(mermaid, engine, input_file, output_file, config)
 
-    # Read input
-    content = input_file.read_text(encoding="utf-8")
+
+async def _convert_one(
+    mermaid: MermaidPreprocessor,
+    engine: PandocEngine,
+    input_file: Path,
+    output_file: Path,
+    config: RuntimeConfig,
+) -> None:
+    """Convert single file using already initialized components.
+
+    The caller must ensure ``config.output.temp_dir`` exists.
+    """
+    # Read input without blocking the event loop
+    content = await _aread_text(input_file)
 
     # Process Mermaid
     file_id = input_file.stem
     processed_content, diagrams = await mermaid.process(content, file_id)
 
-    # Write temp file
-    config.output.temp_dir.mkdir(parents=True, exist_ok=True)
-    temp_md = config.output.temp_dir / f"{input_file.stem}_processed.md"
-    temp_md.write_text(processed_content, encoding="utf-8")
+    # Keep the processed Markdown around only when asked to
+    if config.output.preserve_temp:
+        temp_md = config.output.temp_dir / f"{input_file.stem}_processed.md"
+        temp_md.write_text(processed_content, encoding="utf-8")
+
+    # Convert to PDF straight from memory
+    pdf = await engine.convert_bytes(processed_content.encode("utf-8"))
+    await _awrite_bytes(output_file, pdf)
+
+
+async def _awrite_bytes(path: Path, data: bytes) -> None:
+    """Write a file, creating its directory, in a worker thread."""
+    import asyncio
+
+    def write() -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+
+    await asyncio.to_thread(write)
+
 
-    # Convert to PDF
-    result = await engine.convert(temp_md, output_file)
+async def _aread_text(path: Path) -> str:
+    """Read a UTF-8 text file in a worker thread."""
+    import asyncio
 
-    if not result.success:
-        raise RuntimeError(f"Conversion failed: {result.error}")
+    return await asyncio.to_thread(_read_text_fast, path)
 
-    # Clean up temp file
-    if not config.output.preserve_temp:
-        temp_md.unlink(missing_ok=True)
 
+def _read_text_fast(path: Path) -> str:
+    """Read a UTF-8 text file with one fstat and a read sized to the file.
 
-async def _convert_batch(files: list[Path], config: ProjectConfig) -> Any:
+    Newlines are normalized like ``Path.read_text`` does.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        # Size the first read from fstat so a regular file arrives whole.
+        # Pipes report size 0 and may return short reads before EOF, so
+        # only an empty read ends the loop
+        size = os.fstat(fd).st_size + 1
+        chunks = []
+        while chunk := os.read(fd, size):
+            chunks.append(chunk)
+            size = 65536
+    finally:
+        os.close(fd)
+
+    text = b"".join(chunks).decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+async def _convert_batch(files: list[Path], config: RuntimeConfig) -> Any:
     """Convert batch of files."""
-    # Initialize components
+    from md2pdf_pro.converter import PandocEngine
+    from md2pdf_pro.parallel import BatchProcessor
+    from md2pdf_pro.preprocessor import MermaidPreprocessor
+
+    # Initialize components once for the whole batch
     mermaid = MermaidPreprocessor(config.mermaid)
     engine = PandocEngine(config.pandoc, config.font)
+    config.output.temp_dir.mkdir(parents=True, exist_ok=True)
+    # Without a terminal the progress bar is pure overhead, so it is only
+    # shown on a tty; either way the processor drains the files through a
+    # queue served by min(max_workers, len(files)) workers
     processor = BatchProcessor(
         max_workers=config.processing.max_workers,
-        show_progress=True,
+        show_progress=_console().is_terminal,
+        console=_console(),
     )
 
     async def process_file(file: Path) -> Path:
         output_file = config.output.output_dir / f"{file.stem}.pdf"
-        await _convert_single(file, output_file, config)
+        await _convert_one(mermaid, engine, file, output_file, config)
         return output_file
 
     return await processor.process_batch(files, process_file)
 
 
+async def _convert_book(
+    files: list[Path], output_file: Path, config: RuntimeConfig
+) -> None:
+    """Convert files, in order, into a single PDF with one pandoc run."""
+    import asyncio
+
+    from md2pdf_pro.converter import PandocEngine
+    from md2pdf_pro.preprocessor import MermaidPreprocessor
+
+    mermaid = MermaidPreprocessor(config.mermaid)
+    engine = PandocEngine(config.pandoc, config.font)
+    config.output.temp_dir.mkdir(parents=True, exist_ok=True)
+
+    async def prepare(file: Path, temp_md: Path) -> None:
+        content = await _aread_text(file)
+        processed_content, _ = await mermaid.process(content, file.stem)
+        await asyncio.to_thread(temp_md.write_text, processed_content, "utf-8")
+
+    # Index prefix keeps same-named files from different dirs apart
+    temp_files = [
+        config.output.temp_dir / f"{index:04d}_{file.stem}_processed.md"
+        for index, file in enumerate(files)
+    ]
+    try:
+        # Let every file finish before raising, so none is written after
+        # the cleanup below
+        results = await asyncio.gather(
+            *(prepare(f, t) for f, t in zip(files, temp_files, strict=True)),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        # Raises ConversionError on failure
+        await engine.convert_many(temp_files, output_file)
+    finally:
+        if not config.output.preserve_temp:
+            for temp_md in temp_files:
+                temp_md.unlink(missing_ok=True)
+
+
 async def _watch_and_convert(
     directory: Path,
-    config: ProjectConfig,
+    config: RuntimeConfig,
     recursive: bool,
     debounce_ms: int,
 ) -> None:
     """Watch and convert."""
+    from md2pdf_pro.converter import PandocEngine
+    from md2pdf_pro.preprocessor import MermaidPreprocessor
     from md2pdf_pro.watcher import watch_and_convert
 
+    # Build components once and reuse them for every file event
+    mermaid = MermaidPreprocessor(config.mermaid)
+    engine = PandocEngine(config.pandoc, config.font)
+
     async def convert_file(file: Path) -> None:
         output_file = config.output.output_dir / f"{file.stem}.pdf"
-        await _convert_single(file, output_file, config)
-        console.print(f"[green]✓[/green] Converted: {file.name}")
+        await _convert_single(file, output_file, config, mermaid, engine)
+        _console().print(f"[green]✓[/green] Converted: {file.name}")
 
     await watch_and_convert(
         directory,
         convert_file,
         recursive=recursive,
         debounce_ms=debounce_ms,
+        max_workers=config.processing.max_workers,
     )
 
 
 def _print_batch_results(results: Any) -> None:
     """Print batch conversion results."""
-    console.print("\n[bold]Batch Complete[/bold]")
-    console.print(f"  Success: [green]{results.success}[/green]")
-    console.print(f"  Failed:  [red]{results.failed}[/red]")
-    console.print(f"  Total:   {results.total}")
-    console.print(f"  Duration: {results.total_duration_ms / 1000:.1f}s")
+    _console().print("\n[bold]Batch Complete[/bold]")
+    _console().print(f"  Success: [green]{results.success}[/green]")
+    _console().print(f"  Failed:  [red]{results.failed}[/red]")
+    _console().print(f"  Total:   {results.total}")
+    _console().print(f"  Duration: {results.total_duration_ms / 1000:.1f}s")
 
     if results.failed > 0:
-        console.print("\n[red]Failed files:[/red]")
+        _console().print("\n[red]Failed files:[/red]")
         for path in results.failed_items:
-            console.print(f"  - {path}")
+            _console().print(f"  - {path}")
 
 
 if __name__ == "__main__":
@@ -7,16 +7,38 @@ processing options, and output configuration.
 
 from __future__ import annotations
 
+import json
 import os
+from collections.abc import Callable
+from dataclasses import dataclass
 from enum import Enum
-from pathlib import Path
-from typing import Any
+from functools import lru_cache
+from pathlib import Path, PurePath
+from typing import Any, TypeVar, cast
 
 import yaml
 from pydantic import BaseModel, Field
 
 from md2pdf_pro.errors import ConfigError, ErrorCode
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+RuntimeT = TypeVar("RuntimeT")
+
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with it
+SafeLoader: type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+SafeDumper: type[yaml.SafeDumper] = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+# Dumper subclass that writes paths and enums as plain strings, so the
+# representers don't leak into PyYAML's global SafeDumper
+_ConfigDumper = cast(type[yaml.SafeDumper], type("_ConfigDumper", (SafeDumper,), {}))
+_ConfigDumper.add_multi_representer(
+    PurePath, lambda dumper, data: dumper.represent_str(str(data))
+)
+_ConfigDumper.add_multi_representer(
+    Enum, lambda dumper, data: dumper.represent_data(data.value)
+)
+
 
 class MermaidTheme(str, Enum):
     """Mermaid diagram themes."""
@@ -89,6 +111,7 @@ class MermaidConfig(BaseModel):
     output_dir: Path = Field(
         default_factory=lambda: Path.home() / ".cache" / "md2pdf" / "mermaid"
     )
+    max_concurrent: int | None = None  # concurrent mmdc runs, default CPU count
 
 
 class PandocConfig(BaseModel):
@@ -196,6 +219,124 @@ class PluginConfig(BaseModel):
     config: dict[str, dict[str, Any]] = Field(default_factory=dict)
 
 
+@dataclass(frozen=True, slots=True)
+class RuntimeMermaidConfig:
+    """Read-only Mermaid settings used on the conversion path."""
+
+    theme: MermaidTheme
+    format: MermaidFormat
+    width: int
+    background: str
+    cache_ttl: int
+    output_dir: Path
+    max_concurrent: int | None
+
+
+@dataclass(frozen=True, slots=True)
+class RuntimePandocConfig:
+    """Read-only Pandoc settings used on the conversion path."""
+
+    pdf_engine: PdfEngine
+    template: Path | None
+    highlight_style: str
+    math_engine: MathEngine
+    extra_vars: dict[str, Any]
+    standalone: bool
+    toc: bool
+    toc_depth: int
+    timeout: int
+    extensions: str
+    template_vars: dict[str, Any]
+
+
+@dataclass(frozen=True, slots=True)
+class RuntimeProcessingConfig:
+    """Read-only processing settings used on the conversion path."""
+
+    max_workers: int
+    batch_size: int
+    timeout: int
+    retry_attempts: int
+    retry_backoff: float
+    cpu_threshold: int
+    memory_limit: int
+
+
+@dataclass(frozen=True, slots=True)
+class RuntimeFontConfig:
+    """Read-only font settings used on the conversion path."""
+
+    cjk_primary: str
+    cjk_fallback: tuple[str, ...]
+    latin_primary: str
+    monospace: str
+    geometry_margin: str
+
+
+@dataclass(frozen=True, slots=True)
+class RuntimeOutputConfig:
+    """Read-only output settings used on the conversion path."""
+
+    output_dir: Path
+    temp_dir: Path
+    naming_pattern: str
+    preserve_temp: bool
+    optimize_pdf: bool
+    create_subdirs: bool
+
+
+@dataclass(frozen=True, slots=True)
+class RuntimeLoggingConfig:
+    """Read-only logging settings used on the conversion path."""
+
+    level: LogLevel
+    format: str
+    file: Path | None
+    rotation: str
+    max_bytes: int
+    backup_count: int
+
+
+@dataclass(frozen=True, slots=True)
+class RuntimeConfig:
+    """Validated configuration snapshot for the conversion path.
+
+    Built once from a ProjectConfig via ``ProjectConfig.to_runtime()``;
+    attribute access is a plain slot read instead of going through Pydantic.
+    """
+
+    mermaid: RuntimeMermaidConfig
+    pandoc: RuntimePandocConfig
+    processing: RuntimeProcessingConfig
+    font: RuntimeFontConfig
+    output: RuntimeOutputConfig
+    logging: RuntimeLoggingConfig
+
+
+# String -> enum coercions, memoized since the same env/CLI values are
+# converted on every run
+_to_pdf_engine: Callable[[Any], PdfEngine] = lru_cache(maxsize=None)(PdfEngine)
+_to_log_level: Callable[[Any], LogLevel] = lru_cache(maxsize=None)(LogLevel)
+_to_mermaid_theme: Callable[[Any], MermaidTheme] = lru_cache(maxsize=None)(MermaidTheme)
+
+# Environment variable -> (config section, field, value converter)
+ENV_OVERRIDES: tuple[tuple[str, str, str, Callable[[str], Any]], ...] = (
+    ("MD2PDF_PDF_ENGINE", "pandoc", "pdf_engine", _to_pdf_engine),
+    ("MD2PDF_MAX_WORKERS", "processing", "max_workers", int),
+    ("MD2PDF_OUTPUT_DIR", "output", "output_dir", Path),
+    ("MD2PDF_LOG_LEVEL", "logging", "level", _to_log_level),
+)
+
+# Command-line argument -> (config section, field, value converter)
+ARG_OVERRIDES: tuple[tuple[str, str, str, Callable[[Any], Any]], ...] = (
+    ("pdf_engine", "pandoc", "pdf_engine", _to_pdf_engine),
+    ("max_workers", "processing", "max_workers", int),
+    ("output_dir", "output", "output_dir", Path),
+    ("template", "pandoc", "template", Path),
+    ("theme", "mermaid", "theme", _to_mermaid_theme),
+)
+
+
 class ProjectConfig(BaseModel):
     """Main project configuration."""
 
@@ -246,19 +387,16 @@ class ProjectConfig(BaseModel):
         """
         path = Path(path)
         try:
-            if not path.exists():
-                raise ConfigError(
-                    f"Configuration file not found: {path}",
-                    ErrorCode.CONFIG_NOT_FOUND,
-                    {"path": str(path)},
-                )
-
-            with open(path, encoding="utf-8") as f:
-                data = yaml.safe_load(f) or {}
+            stat = path.stat()
+        except FileNotFoundError:
+            raise ConfigError(
+                f"Configuration file not found: {path}",
+                ErrorCode.CONFIG_NOT_FOUND,
+                {"path": str(path)},
+            )
 
-            return cls(**data)
-        except ConfigError:
-            raise
+        try:
+            config = _load_yaml_cached(cls, str(path), stat.st_mtime_ns, stat.st_size)
         except Exception as e:
             raise ConfigError(
                 f"Failed to load config from {path}: {e}",
@@ -267,6 +405,9 @@ class ProjectConfig(BaseModel):
                 e,
             )
 
+        # The cached instance is shared; hand out a copy callers may mutate
+        return config.model_copy(deep=True)
+
     def to_yaml(self, path: Path | str) -> None:
         """Save configuration to YAML file.
 
@@ -280,11 +421,18 @@ class ProjectConfig(BaseModel):
         try:
             path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Convert to dict, excluding None values
-            data = self.model_dump(exclude_none=True, mode="json")
+            # Convert to dict, excluding None values; paths and enums are
+            # handled by the dumper instead of a JSON-mode round trip
+            data = self.model_dump(exclude_none=True)
 
             with open(path, "w", encoding="utf-8") as f:
-                yaml.safe_dump(data, f, default_flow_style=False, allow_unicode=True)
+                yaml.dump(
+                    data,
+                    f,
+                    Dumper=_ConfigDumper,
+                    default_flow_style=False,
+                    allow_unicode=True,
+                )
         except Exception as e:
             from md2pdf_pro.errors import ErrorCode, FileError
 
@@ -304,22 +452,31 @@ class ProjectConfig(BaseModel):
         Returns:
             ProjectConfig instance
         """
-        config = cls()
+        env = os.environ
+        overrides: dict[str, dict[str, Any]] = {}
 
         # Override from environment
-        if os.getenv("MD2PDF_PDF_ENGINE"):
-            config.pandoc.pdf_engine = PdfEngine(os.getenv("MD2PDF_PDF_ENGINE"))
+        for var, section, field, convert in ENV_OVERRIDES:
+            if value := env.get(var):
+                overrides.setdefault(section, {})[field] = convert(value)
+
+        return cls(**overrides)
 
-        if max_workers := os.getenv("MD2PDF_MAX_WORKERS"):
-            config.processing.max_workers = int(max_workers)
+    def with_overrides(self, overrides: dict[str, Any]) -> ProjectConfig:
+        """Return a copy with the given (possibly nested) fields replaced.
 
-        if output_dir := os.getenv("MD2PDF_OUTPUT_DIR"):
-            config.output.output_dir = Path(output_dir)
+        Nested dicts address sub-configurations, e.g.
+        ``{"processing": {"max_workers": 4}}``. Only the sub-configurations
+        that are touched get copied; the rest are shared with this instance.
+        Values are not re-validated, so they must already have the field type.
 
-        if os.getenv("MD2PDF_LOG_LEVEL"):
-            config.logging.level = LogLevel(os.getenv("MD2PDF_LOG_LEVEL"))
+        Args:
+            overrides: Mapping of field names to new values or nested overrides
 
-        return config
+        Returns:
+            New ProjectConfig with overrides applied
+        """
+        return _copy_with_overrides(self, overrides)
 
     def merge_with_args(self, args: dict[str, Any]) -> ProjectConfig:
         """Merge configuration with command-line arguments.
@@ -328,27 +485,103 @@ class ProjectConfig(BaseModel):
             args: Dictionary of command-line arguments
 
         Returns:
-            New ProjectConfig with merged settings
+            New ProjectConfig with merged settings; sub-configurations
+            without overrides are shared with this instance
         """
-        config = self.model_copy(deep=True)
+        overrides: dict[str, dict[str, Any]] = {}
 
         # Override with args
-        if "pdf_engine" in args and args["pdf_engine"]:
-            config.pandoc.pdf_engine = PdfEngine(args["pdf_engine"])
+        for key, section, field, convert in ARG_OVERRIDES:
+            if value := args.get(key):
+                overrides.setdefault(section, {})[field] = convert(value)
+
+        return self.with_overrides(overrides)
+
+    def to_runtime(self) -> RuntimeConfig:
+        """Convert to a frozen snapshot for the conversion path.
+
+        Returns:
+            RuntimeConfig mirroring the sections used during conversion
+        """
+        return RuntimeConfig(
+            mermaid=_to_runtime(RuntimeMermaidConfig, self.mermaid),
+            pandoc=_to_runtime(RuntimePandocConfig, self.pandoc),
+            processing=_to_runtime(RuntimeProcessingConfig, self.processing),
+            font=_to_runtime(RuntimeFontConfig, self.font),
+            output=_to_runtime(RuntimeOutputConfig, self.output),
+            logging=_to_runtime(RuntimeLoggingConfig, self.logging),
+        )
+
+
+def _to_runtime(cls: Callable[..., RuntimeT], model: BaseModel) -> RuntimeT:
+    """Copy a model's fields into the matching runtime dataclass.
+
+    Lists become tuples and dicts are copied, so the snapshot does not
+    share mutable state with the source model.
+    """
+    values: dict[str, Any] = {}
+    for name in type(model).model_fields:
+        value = getattr(model, name)
+        if isinstance(value, list):
+            value = tuple(value)
+        elif isinstance(value, dict):
+            value = dict(value)
+        values[name] = value
+    return cls(**values)
+
+
+def _copy_with_overrides(model: ModelT, overrides: dict[str, Any]) -> ModelT:
+    """Copy a model, recursing into nested models for dict overrides."""
+    update: dict[str, Any] = {}
+    for name, value in overrides.items():
+        current = getattr(model, name)
+        if isinstance(current, BaseModel) and isinstance(value, dict):
+            if value:
+                update[name] = _copy_with_overrides(current, value)
+        else:
+            update[name] = value
+    return model.model_copy(update=update)
+
+
+@lru_cache(maxsize=32)
+def _load_yaml_cached(
+    cls: type[ProjectConfig], path_str: str, mtime_ns: int, size: int
+) -> ProjectConfig:
+    """Parse and validate a YAML config file.
+
+    Results are memoized on (path, mtime_ns, size), so an unchanged file is
+    only parsed once per process. ``mtime_ns`` and ``size`` are part of the
+    key purely to invalidate the entry when the file changes.
+
+    Args:
+        cls: Config class to construct
+        path_str: Path to YAML configuration file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
 
-        if "max_workers" in args and args["max_workers"]:
-            config.processing.max_workers = args["max_workers"]
+    Returns:
+        Validated config instance (shared, must not be mutated)
+    """
+    with open(path_str, "rb") as f:
+        raw = f.read()
+
+    # JSON is a subset of YAML and much cheaper to parse; YAML flow
+    # mappings that are not valid JSON fall through to the YAML loader
+    data: Any = None
+    if raw.lstrip()[:1] in (b"{", b"["):
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            data = None
 
-        if "output_dir" in args and args["output_dir"]:
-            config.output.output_dir = Path(args["output_dir"])
+    if data is None:
+        data = yaml.load(raw, Loader=SafeLoader) or {}
 
-        if "template" in args and args["template"]:
-            config.pandoc.template = Path(args["template"])
+    return cls(**data)
 
-        if "theme" in args and args["theme"]:
-            config.mermaid.theme = MermaidTheme(args["theme"])
 
-        return config
+# Config file names looked up in the current working directory, in order
+DEFAULT_CONFIG_NAMES = ("md2pdf.yaml", ".md2pdf.yaml")
 
 
 def get_default_config_path() -> Path:
@@ -357,18 +590,19 @@ def get_default_config_path() -> Path:
     Returns:
         Path to default config file
     """
-    # Check multiple locations
-    candidates = [
-        Path.cwd() / "md2pdf.yaml",
-        Path.cwd() / ".md2pdf.yaml",
-        Path.home() / ".md2pdf" / "config.yaml",
-    ]
-
-    for path in candidates:
-        if path.exists():
-            return path
+    cwd = Path.cwd()
+
+    # One stat per candidate name, independent of the directory's size
+    for name in DEFAULT_CONFIG_NAMES:
+        candidate = cwd / name
+        if os.path.isfile(candidate):
+            return candidate
+
+    user_config = Path.home() / ".md2pdf" / "config.yaml"
+    if user_config.exists():
+        return user_config
 
-    return candidates[0]
+    return cwd / DEFAULT_CONFIG_NAMES[0]
 
 
 def init_config(path: Path | str | None = None) -> ProjectConfig:
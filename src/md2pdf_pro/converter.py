@@ -8,8 +8,14 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import shutil
 import subprocess
+import tempfile
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -18,6 +24,8 @@ from md2pdf_pro.config import (
     PandocConfig,
     PdfCompression,
     PdfMetadataConfig,
+    RuntimeFontConfig,
+    RuntimePandocConfig,
     WatermarkConfig,
 )
 from md2pdf_pro.errors import ConversionError, DependencyError, ErrorCode
@@ -54,8 +62,8 @@ class PandocEngine:
 
     def __init__(
         self,
-        config: PandocConfig,
-        font_config: FontConfig | None = None,
+        config: PandocConfig | RuntimePandocConfig,
+        font_config: FontConfig | RuntimeFontConfig | None = None,
     ):
         """Initialize Pandoc engine.
 
@@ -64,25 +72,23 @@ class PandocEngine:
             font_config: Optional font configuration
         """
         self.config = config
-        self.font_config = font_config or FontConfig()
+        self.font_config: FontConfig | RuntimeFontConfig = font_config or FontConfig()
         self._pandoc_available: bool | None = None
         self._pandoc_version: str | None = None
+        # Absolute path so each launch skips the $PATH walk; replaced by the
+        # probed path once availability is checked
+        self._pandoc_path: str | None = resolve_command("pandoc")
+        self._static_args_cache: tuple[str, ...] | None = None
+        # Whether this pandoc can write a PDF to stdout (older releases
+        # reject "-t pdf -o -"); None until a run has shown either way
+        self._pdf_to_stdout: bool | None = None
+        self._probe_lock = asyncio.Lock()
 
     @property
     def version(self) -> str | None:
         """Get Pandoc version."""
         if self._pandoc_version is None:
-            try:
-                result = subprocess.run(
-                    ["pandoc", "--version"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-                if result.returncode == 0:
-                    self._pandoc_version = result.stdout.split("\n")[0].strip()
-            except (FileNotFoundError, subprocess.TimeoutExpired):
-                pass
+            self._pandoc_version = probe_command("pandoc")[1]
         return self._pandoc_version
 
     def is_available(self) -> bool:
@@ -92,18 +98,26 @@ class PandocEngine:
             True if Pandoc is installed
         """
         if self._pandoc_available is None:
-            try:
-                result = subprocess.run(
-                    ["pandoc", "--version"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-                self._pandoc_available = result.returncode == 0
-            except (FileNotFoundError, subprocess.TimeoutExpired):
-                self._pandoc_available = False
+            self._pandoc_path = probe_command("pandoc")[0]
+            self._pandoc_available = self._pandoc_path is not None
         return self._pandoc_available
 
+    async def _is_available_async(self) -> bool:
+        """Check if Pandoc is available without blocking the event loop.
+
+        The first check spawns ``pandoc --version``, so it runs in a worker
+        thread under a lock; later checks return the cached answer directly.
+
+        Returns:
+            True if Pandoc is installed
+        """
+        if self._pandoc_available is None:
+            # Concurrent conversions share one probe instead of racing to spawn
+            async with self._probe_lock:
+                if self._pandoc_available is None:
+                    await asyncio.to_thread(self.is_available)
+        return self.is_available()
+
     async def convert(
         self,
         input_file: Path,
@@ -126,7 +140,7 @@ class PandocEngine:
             DependencyError: If pandoc is not found
             ConversionError: If conversion fails
         """
-        if not self.is_available():
+        if not await self._is_available_async():
             raise DependencyError(
                 "pandoc command not found. Please install Pandoc: "
                 "https://pandoc.org/installing.html",
@@ -140,15 +154,101 @@ class PandocEngine:
         # Build command arguments
         args = self._build_args(input_file, output_file, metadata)
 
+        return await self._run_pandoc(
+            args,
+            output_file,
+            timeout,
+            {"input_file": str(input_file), "output_file": str(output_file)},
+        )
+
+    async def convert_many(
+        self,
+        input_files: list[Path],
+        output_file: Path,
+        metadata: dict[str, Any] | None = None,
+        timeout: int | None = None,
+    ) -> ConversionResult:
+        """Convert several Markdown files into a single PDF.
+
+        All inputs go to one pandoc run, so the PDF engine starts once
+        instead of once per file. ``--file-scope`` keeps footnotes and link
+        references local to the file they appear in.
+
+        Args:
+            input_files: Input Markdown file paths, in document order
+            output_file: Output PDF file path
+            metadata: Optional metadata dictionary
+            timeout: Optional timeout in seconds
+
+        Returns:
+            ConversionResult with success status and details
+
+        Raises:
+            DependencyError: If pandoc is not found
+            ConversionError: If conversion fails
+        """
+        if not await self._is_available_async():
+            raise DependencyError(
+                "pandoc command not found. Please install Pandoc: "
+                "https://pandoc.org/installing.html",
+                ErrorCode.DEPENDENCY_MISSING,
+                {"dependency": "pandoc"},
+            )
+
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+
+        args = [
+            *(str(f) for f in input_files),
+            "--file-scope",
+            "-o",
+            str(output_file),
+            *self._static_args(),
+            *self._metadata_args(metadata),
+        ]
+
+        return await self._run_pandoc(
+            args,
+            output_file,
+            timeout,
+            {
+                "input_files": [str(f) for f in input_files],
+                "output_file": str(output_file),
+            },
+        )
+
+    async def _run_pandoc(
+        self,
+        args: list[str],
+        output_file: Path,
+        timeout: int | None,
+        details: dict[str, Any],
+    ) -> ConversionResult:
+        """Run pandoc with the given arguments and wait for it.
+
+        Args:
+            args: Pandoc command arguments
+            output_file: Output PDF file path
+            timeout: Optional timeout in seconds
+            details: Context added to raised errors
+
+        Returns:
+            ConversionResult for a successful run
+
+        Raises:
+            DependencyError: If pandoc is not found
+            ConversionError: If conversion fails or times out
+        """
         # Set timeout
         timeout = timeout or self.config.timeout or 300
 
         # Execute asynchronously
-        start_time = asyncio.get_event_loop().time()
+        start_ns = time.perf_counter_ns()
 
+        # One pandoc process per document: `pandoc server` would keep the
+        # runtime warm, but it runs sandboxed and cannot invoke a PDF engine
         try:
             process = await asyncio.create_subprocess_exec(
-                "pandoc",
+                self._pandoc_path or "pandoc",
                 *args,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
@@ -164,14 +264,10 @@ class PandocEngine:
                 raise ConversionError(
                     "Conversion timed out",
                     ErrorCode.CONVERSION_TIMEOUT,
-                    {
-                        "input_file": str(input_file),
-                        "output_file": str(output_file),
-                        "timeout": timeout,
-                    },
+                    {**details, "timeout": timeout},
                 )
 
-            duration = (asyncio.get_event_loop().time() - start_time) * 1000
+            duration = (time.perf_counter_ns() - start_ns) / 1e6
 
             if process.returncode == 0:
                 return ConversionResult(
@@ -184,11 +280,7 @@ class PandocEngine:
                 raise ConversionError(
                     f"Pandoc conversion failed: {error_msg}",
                     ErrorCode.CONVERSION_FAILED,
-                    {
-                        "input_file": str(input_file),
-                        "output_file": str(output_file),
-                        "error_code": process.returncode,
-                    },
+                    {**details, "error_code": process.returncode},
                 )
 
         except FileNotFoundError:
@@ -203,13 +295,146 @@ class PandocEngine:
             raise ConversionError(
                 f"An error occurred during conversion: {str(e)}",
                 ErrorCode.CONVERSION_FAILED,
-                {
-                    "input_file": str(input_file),
-                    "output_file": str(output_file),
-                },
+                details,
                 e,
             )
 
+    async def convert_bytes(
+        self,
+        markdown: bytes,
+        metadata: dict[str, Any] | None = None,
+        timeout: int | None = None,
+    ) -> bytes:
+        """Convert in-memory Markdown to PDF through stdin and stdout.
+
+        Avoids writing the Markdown to a temporary file only for Pandoc to
+        read it back, and lets the caller decide where the PDF goes. Pandoc
+        releases that cannot write PDF to stdout are detected on the first
+        failed run, which is retried (as are all later runs) through
+        temporary files.
+
+        Args:
+            markdown: UTF-8 encoded Markdown source
+            metadata: Optional metadata dictionary
+            timeout: Optional timeout in seconds
+
+        Returns:
+            The generated PDF document
+
+        Raises:
+            DependencyError: If pandoc is not found
+            ConversionError: If conversion fails
+        """
+        if not await self._is_available_async():
+            raise DependencyError(
+                "pandoc command not found. Please install Pandoc: "
+                "https://pandoc.org/installing.html",
+                ErrorCode.DEPENDENCY_MISSING,
+                {"dependency": "pandoc"},
+            )
+
+        if self._pdf_to_stdout is False:
+            return await self._convert_bytes_via_files(markdown, metadata, timeout)
+
+        args = [
+            "-t",
+            "pdf",
+            "-o",
+            "-",
+            *self._static_args(),
+            *self._metadata_args(metadata),
+        ]
+        timeout = timeout or self.config.timeout or 300
+        details: dict[str, Any] = {"input_bytes": len(markdown)}
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                self._pandoc_path or "pandoc",
+                *args,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except FileNotFoundError:
+            raise DependencyError(
+                "pandoc command not found",
+                ErrorCode.DEPENDENCY_MISSING,
+                {"dependency": "pandoc"},
+            )
+
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                process.communicate(markdown), timeout=timeout
+            )
+        except TimeoutError:
+            process.kill()
+            await process.wait()
+            raise ConversionError(
+                "Conversion timed out",
+                ErrorCode.CONVERSION_TIMEOUT,
+                {**details, "timeout": timeout},
+            )
+
+        if process.returncode != 0:
+            if self._pdf_to_stdout is None:
+                # Possibly a pandoc without PDF-to-stdout support; retry with
+                # files and remember the answer if that run succeeds
+                error_msg = stderr.decode(errors="replace") if stderr else ""
+                logger.debug(f"Pandoc PDF to stdout failed, using files: {error_msg}")
+                pdf = await self._convert_bytes_via_files(markdown, metadata, timeout)
+                self._pdf_to_stdout = False
+                return pdf
+
+            error_msg = stderr.decode(errors="replace") if stderr else "Unknown error"
+            raise ConversionError(
+                f"Pandoc conversion failed: {error_msg}",
+                ErrorCode.CONVERSION_FAILED,
+                {**details, "error_code": process.returncode},
+            )
+
+        self._pdf_to_stdout = True
+        return stdout
+
+    async def _convert_bytes_via_files(
+        self,
+        markdown: bytes,
+        metadata: dict[str, Any] | None,
+        timeout: int | None,
+    ) -> bytes:
+        """Convert in-memory Markdown to PDF through temporary files.
+
+        Args:
+            markdown: UTF-8 encoded Markdown source
+            metadata: Optional metadata dictionary
+            timeout: Optional timeout in seconds
+
+        Returns:
+            The generated PDF document
+
+        Raises:
+            DependencyError: If pandoc is not found
+            ConversionError: If conversion fails
+        """
+        with tempfile.TemporaryDirectory(prefix="md2pdf_") as tmp:
+            input_file = Path(tmp) / "input.md"
+            output_file = Path(tmp) / "output.pdf"
+            await asyncio.to_thread(input_file.write_bytes, markdown)
+            await self._run_pandoc(
+                self._build_args(input_file, output_file, metadata),
+                output_file,
+                timeout,
+                {"input_bytes": len(markdown)},
+            )
+            try:
+                return await asyncio.to_thread(output_file.read_bytes)
+            except OSError as e:
+                raise ConversionError(
+                    f"Output file not created: {e}",
+                    ErrorCode.CONVERSION_FAILED,
+                    {"input_bytes": len(markdown)},
+                    e,
+                )
+
     def _build_args(
         self,
         input_file: Path,
@@ -226,50 +451,86 @@ class PandocEngine:
         Returns:
             List of command arguments
         """
-        args: list[str] = [
+        return [
             str(input_file),
             "-o",
             str(output_file),
-            "--standalone" if self.config.standalone else "",
-            f"--pdf-engine={self.config.pdf_engine.value}",
-            f"--highlight-style={self.config.highlight_style}",
-            f"-fmarkdown{self.config.extensions}",
+            *self._static_args(),
+            *self._metadata_args(metadata),
         ]
 
-        # Add template if specified
-        if self.config.template:
-            args.extend(["--template", str(self.config.template)])
+    @staticmethod
+    def _metadata_args(metadata: dict[str, Any] | None) -> Iterator[str]:
+        """Generate ``-M`` arguments for per-document metadata.
 
-        # Table of contents
-        if self.config.toc:
-            args.extend(["--toc", f"--toc-depth={self.config.toc_depth}"])
+        Args:
+            metadata: Optional metadata
 
-        # Math engine
-        if self.config.math_engine.value == "mathspec":
-            args.extend(["-V", "mathspec=true"])
+        Yields:
+            Command arguments
+        """
+        if metadata:
+            for key, value in metadata.items():
+                yield "-M"
+                yield f"{key}={value}"
 
-        # Add font configuration
-        args.extend(self._get_font_args())
+    def _static_args(self) -> tuple[str, ...]:
+        """Get the arguments that depend only on configuration.
 
-        # Add extra variables
-        for key, value in self.config.extra_vars.items():
-            args.extend(["-V", f"{key}={value}"])
+        Frozen runtime configs cannot change, so their arguments are built
+        once per engine; mutable Pydantic configs are re-read on each call.
 
-        # Add template variables
-        for key, value in self.config.template_vars.items():
-            args.extend(["-V", f"{key}={value}"])
-        for key, value in self.config.extra_vars.items():
-            args.extend(["-V", f"{key}={value}"])
+        Returns:
+            Tuple of command arguments
+        """
+        if self._static_args_cache is not None:
+            return self._static_args_cache
 
-        # Add metadata
-        if metadata:
-            for key, value in metadata.items():
-                args.extend(["-M", f"{key}={value}"])
+        # Filter out empty strings while materializing the tuple once
+        static_args = tuple(arg for arg in self._iter_static_args() if arg)
+
+        if isinstance(self.config, RuntimePandocConfig) and isinstance(
+            self.font_config, RuntimeFontConfig
+        ):
+            self._static_args_cache = static_args
+        return static_args
+
+    def _iter_static_args(self) -> Iterator[str]:
+        """Generate the configuration-dependent arguments in order.
 
-        # Filter out empty strings
-        args = [arg for arg in args if arg]
+        Yields:
+            Command arguments (possibly empty strings)
+        """
+        config = self.config
+        yield "--standalone" if config.standalone else ""
+        yield f"--pdf-engine={config.pdf_engine.value}"
+        yield f"--highlight-style={config.highlight_style}"
+        yield f"-fmarkdown{config.extensions}"
+
+        # Add template if specified
+        if config.template:
+            yield "--template"
+            yield str(config.template)
 
-        return args
+        # Table of contents
+        if config.toc:
+            yield "--toc"
+            yield f"--toc-depth={config.toc_depth}"
+
+        # Math engine
+        if config.math_engine.value == "mathspec":
+            yield "-V"
+            yield "mathspec=true"
+
+        # Add font configuration
+        yield from self._get_font_args()
+
+        # Add extra variables and template variables; extra variables are
+        # emitted both before and after the template variables
+        for variables in (config.extra_vars, config.template_vars, config.extra_vars):
+            for key, value in variables.items():
+                yield "-V"
+                yield f"{key}={value}"
 
     def _get_font_args(self) -> list[str]:
         """Get font-related Pandoc arguments.
@@ -277,79 +538,82 @@ class PandocEngine:
         Returns:
             List of font argument pairs
         """
-        args: list[str] = []
-
-        # CJK main font
-        args.extend(
-            [
-                "-V",
-                f"CJKmainfont={self.font_config.cjk_primary}",
-            ]
-        )
+        font = self.font_config
+        return [
+            # CJK main font
+            "-V",
+            f"CJKmainfont={font.cjk_primary}",
+            # Latin main font
+            "-V",
+            f"mainfont={font.latin_primary}",
+            # Monospace font
+            "-V",
+            f"monofont={font.monospace}",
+            # Geometry (page margins)
+            "-V",
+            f"geometry:margin={font.geometry_margin}",
+        ]
 
-        # Latin main font
-        args.extend(
-            [
-                "-V",
-                f"mainfont={self.font_config.latin_primary}",
-            ]
-        )
 
-        # Monospace font
-        args.extend(
-            [
-                "-V",
-                f"monofont={self.font_config.monospace}",
-            ]
-        )
+def check_dependencies() -> dict[str, bool]:
+    """Check if required dependencies are available.
 
-        # Geometry (page margins)
-        args.extend(
-            [
-                "-V",
-                f"geometry:margin={self.font_config.geometry_margin}",
-            ]
-        )
+    Returns:
+        Dictionary mapping dependency name to availability
+    """
+    names = ("pandoc", "tectonic", "xelatex")
 
-        return args
+    # Each probe is an independent subprocess, so run them concurrently
+    with ThreadPoolExecutor(max_workers=len(names)) as pool:
+        probes = pool.map(probe_command, names)
+        return {
+            name: path is not None
+            for name, (path, _version) in zip(names, probes, strict=True)
+        }
 
 
-def check_dependencies() -> dict[str, bool]:
-    """Check if required dependencies are available.
+@lru_cache(maxsize=None)
+def resolve_command(name: str) -> str | None:
+    """Resolve a command to its absolute path once per process.
+
+    Args:
+        name: Command name
 
     Returns:
-        Dictionary mapping dependency name to availability
+        Absolute path, or None if the command is not on PATH
     """
-    deps = {
-        "pandoc": False,
-        "tectonic": False,
-        "xelatex": False,
-    }
+    return shutil.which(name)
+
+
+@lru_cache(maxsize=None)
+def probe_command(name: str) -> tuple[str | None, str | None]:
+    """Locate a command and read its ``--version`` banner.
 
-    # Check Pandoc
+    Results are cached for the life of the process, so each binary is
+    spawned at most once; a command missing from PATH is never spawned.
+
+    Args:
+        name: Command name
+
+    Returns:
+        Tuple of (absolute path, first line of version output); both are
+        None if the command is missing or does not run successfully
+    """
+    path = shutil.which(name)
+    if path is None:
+        return None, None
     try:
         result = subprocess.run(
-            ["pandoc", "--version"],
+            [path, "--version"],
             capture_output=True,
+            text=True,
             timeout=5,
         )
-        deps["pandoc"] = result.returncode == 0
-    except (FileNotFoundError, subprocess.TimeoutExpired):
-        pass
-
-    # Check PDF engines
-    for engine in ["tectonic", "xelatex"]:
-        try:
-            result = subprocess.run(
-                [engine, "--version"],
-                capture_output=True,
-                timeout=5,
-            )
-            deps[engine] = result.returncode == 0
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            pass
-
-    return deps
+    except (OSError, subprocess.TimeoutExpired):
+        return None, None
+    if result.returncode != 0:
+        return None, None
+    return path, result.stdout.split("\n")[0].strip()
 
 
 def optimize_pdf(
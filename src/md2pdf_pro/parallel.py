@@ -9,6 +9,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
+from array import array
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -43,15 +44,125 @@ class ProcessingResult:
 
 
 @dataclass
+class ResultColumns:
+    """Per-item batch outcomes stored column-wise.
+
+    Large batches keep one flag and one float per item instead of one
+    ProcessingResult object each; errors and output paths are sparse.
+    """
+
+    input_paths: list[Path]
+    success_mask: bytearray
+    durations: array[float]
+    errors: dict[int, str] = field(default_factory=dict)
+    output_paths: dict[int, Path] = field(default_factory=dict)
+
+    @classmethod
+    def for_items(cls, items: list[Path]) -> ResultColumns:
+        """Create empty columns sized for the given items."""
+        return cls(
+            input_paths=list(items),
+            success_mask=bytearray(len(items)),
+            durations=array("d", bytes(8 * len(items))),
+        )
+
+    @classmethod
+    def from_results(cls, results: list[ProcessingResult]) -> ResultColumns:
+        """Build columns from already materialized results."""
+        columns = cls.for_items([r.input_path for r in results])
+        for index, result in enumerate(results):
+            columns.record(index, result)
+        return columns
+
+    def record(self, index: int, result: ProcessingResult) -> None:
+        """Store the outcome of the item at ``index``."""
+        self.success_mask[index] = result.success
+        self.durations[index] = result.duration_ms
+        if result.error is not None:
+            self.errors[index] = result.error
+        if result.output_path is not None:
+            self.output_paths[index] = result.output_path
+
+    @property
+    def success_count(self) -> int:
+        """Number of successful items."""
+        return sum(self.success_mask)
+
+    def failed_items(self) -> list[Path]:
+        """Get input paths of failed items."""
+        return [
+            path
+            for path, ok in zip(self.input_paths, self.success_mask, strict=True)
+            if not ok
+        ]
+
+    def to_results(self) -> list[ProcessingResult]:
+        """Materialize one ProcessingResult per item."""
+        return [
+            ProcessingResult(
+                success=bool(self.success_mask[i]),
+                input_path=path,
+                output_path=self.output_paths.get(i),
+                error=self.errors.get(i),
+                duration_ms=self.durations[i],
+            )
+            for i, path in enumerate(self.input_paths)
+        ]
+
+
 class BatchResult:
-    """Result of batch processing."""
+    """Result of batch processing.
+
+    Per-item outcomes live in ``columns``; ``results`` builds the
+    ProcessingResult list on first access.
+    """
+
+    def __init__(
+        self,
+        total: int,
+        success: int,
+        failed: int,
+        skipped: int,
+        results: list[ProcessingResult] | None = None,
+        total_duration_ms: float = 0.0,
+        *,
+        columns: ResultColumns | None = None,
+    ):
+        """Initialize batch result.
 
-    total: int
-    success: int
-    failed: int
-    skipped: int
-    results: list[ProcessingResult] = field(default_factory=list)
-    total_duration_ms: float = 0.0
+        Args:
+            total: Number of items in the batch
+            success: Number of successful items
+            failed: Number of failed items
+            skipped: Number of skipped items
+            results: Optional per-item results
+            total_duration_ms: Wall time of the batch
+            columns: Optional per-item results in column form
+        """
+        self.total = total
+        self.success = success
+        self.failed = failed
+        self.skipped = skipped
+        self.total_duration_ms = total_duration_ms
+        if columns is None:
+            results = results or []
+            columns = ResultColumns.from_results(results)
+        self.columns = columns
+        self._results = results
+
+    def __repr__(self) -> str:
+        return (
+            f"BatchResult(total={self.total}, success={self.success}, "
+            f"failed={self.failed}, skipped={self.skipped}, "
+            f"total_duration_ms={self.total_duration_ms})"
+        )
+
+    @property
+    def results(self) -> list[ProcessingResult]:
+        """Get per-item results."""
+        if self._results is None:
+            self._results = self.columns.to_results()
+        return self._results
 
     @property
     def success_rate(self) -> float:
@@ -63,7 +174,7 @@ class BatchResult:
     @property
     def failed_items(self) -> list[Path]:
         """Get list of failed item paths."""
-        return [r.input_path for r in self.results if not r.success]
+        return self.columns.failed_items()
 
 
 class BatchProcessor:
@@ -121,8 +232,7 @@ class BatchProcessor:
         if not items:
             return BatchResult(total=0, success=0, failed=0, skipped=0)
 
-        start_time = time.time()
-        semaphore = asyncio.Semaphore(self.max_workers)
+        start_ns = time.perf_counter_ns()
 
         # Create progress bar
         if self.show_progress:
@@ -133,69 +243,67 @@ class BatchProcessor:
                 TaskProgressColumn(),
                 TimeRemainingColumn(),
                 console=self.console,
+                # Workers advance the bar per item; cap how often it redraws
+                refresh_per_second=10,
             )
             self.progress.start()
             self._task_id = self.progress.add_task(
                 f"[cyan]{task_name}", total=len(items)
             )
 
-        # Process all items
-        async def process_with_semaphore(item: Path) -> ProcessingResult:
-            async with semaphore:
-                result = await self._process_with_retry(
-                    item, process_fn, retry_attempts, retry_backoff
-                )
-                # Update progress after each item
-                if self.progress and self._task_id is not None:
-                    self.progress.update(self._task_id, advance=1)
-                return result
-
-        # Run all tasks concurrently
-        tasks = [process_with_semaphore(item) for item in items]
-        results: list[ProcessingResult | BaseException] = await asyncio.gather(
-            *tasks, return_exceptions=True
+        # A fixed pool of workers pulls items from a bounded queue, so only
+        # max_workers coroutines exist no matter how large the batch is
+        worker_count = min(self.max_workers, len(items))
+        queue: asyncio.Queue[tuple[int, Path] | None] = asyncio.Queue(
+            maxsize=worker_count * 2
         )
-
-        # Convert exceptions to failed results
-        final_results: list[ProcessingResult] = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                final_results.append(
-                    ProcessingResult(
-                        success=False,
-                        input_path=items[i],
-                        error=str(result),
+        columns = ResultColumns.for_items(items)
+
+        async def worker() -> None:
+            while (entry := await queue.get()) is not None:
+                index, item = entry
+                try:
+                    result = await self._process_with_retry(
+                        item, process_fn, retry_attempts, retry_backoff
                     )
-                )
-            elif isinstance(result, ProcessingResult):
-                final_results.append(result)
-            else:
-                final_results.append(
-                    ProcessingResult(
-                        success=False,
-                        input_path=items[i],
-                        error=f"Unexpected result type: {type(result)}",
+                except Exception as e:
+                    # Convert exceptions to failed results
+                    result = ProcessingResult(
+                        success=False, input_path=item, error=str(e)
                     )
-                )
+                columns.record(index, result)
+                # Update progress after each item
+                if self.progress and self._task_id is not None:
+                    self.progress.advance(self._task_id)
 
-        # Update progress to complete
-        if self.progress and self._task_id is not None:
-            self.progress.stop()
+        workers = [asyncio.create_task(worker()) for _ in range(worker_count)]
+        try:
+            for entry in enumerate(items):
+                await queue.put(entry)
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+            # Stop the live display even if the batch was interrupted
+            if self.progress and self._task_id is not None:
+                self.progress.stop()
 
         # Calculate statistics
-        success_count = sum(1 for r in final_results if r.success)
-        failed_count = sum(1 for r in final_results if not r.success)
+        success_count = columns.success_count
+        failed_count = len(items) - success_count
         skipped_count = 0  # Could add skip logic
 
-        total_duration = (time.time() - start_time) * 1000
+        total_duration = (time.perf_counter_ns() - start_ns) / 1e6
 
         return BatchResult(
             total=len(items),
             success=success_count,
             failed=failed_count,
             skipped=skipped_count,
-            results=final_results,
             total_duration_ms=total_duration,
+            columns=columns,
         )
 
     async def _process_with_retry(
@@ -217,12 +325,12 @@ class BatchProcessor:
             ProcessingResult
         """
         last_error: str | None = None
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         for attempt in range(max_attempts + 1):
             try:
                 result = await process_fn(item)
-                duration = (time.time() - start_time) * 1000
+                duration = (time.perf_counter_ns() - start_ns) / 1e6
 
                 if isinstance(result, Path):
                     return ProcessingResult(
@@ -255,7 +363,7 @@ class BatchProcessor:
                     wait_time = backoff**attempt
                     await asyncio.sleep(wait_time)
 
-        duration = (time.time() - start_time) * 1000
+        duration = (time.perf_counter_ns() - start_ns) / 1e6
         return ProcessingResult(
             success=False,
             input_path=item,
@@ -294,6 +402,15 @@ class AdaptiveBatchProcessor(BatchProcessor):
         self.cpu_threshold = cpu_threshold
         self.memory_threshold = memory_threshold
 
+        # Non-blocking cpu_percent() reports usage since the previous call;
+        # take a first sample now so the next reading is meaningful
+        try:
+            import psutil
+
+            psutil.cpu_percent(interval=None)
+        except ImportError:
+            logger.debug("psutil not available, adaptive concurrency disabled")
+
     def _get_current_workers(self) -> int:
         """Calculate current workers based on system load.
 
@@ -303,7 +420,8 @@ class AdaptiveBatchProcessor(BatchProcessor):
         try:
             import psutil
 
-            cpu_percent = psutil.cpu_percent(interval=0.1)
+            # Usage since the last sample; never sleeps
+            cpu_percent = psutil.cpu_percent(interval=None)
             memory_percent = psutil.virtual_memory().percent
 
             # Reduce workers if system is under load
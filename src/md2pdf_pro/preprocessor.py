@@ -6,14 +6,23 @@ in Markdown files, converting them to PDF vector graphics.
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
+import json
 import logging
+import os
 import re
-import subprocess
 import tempfile
 from pathlib import Path
+from typing import Any, NamedTuple
 
-from md2pdf_pro.config import MermaidConfig, MermaidFormat, MermaidTheme
+from md2pdf_pro.config import (
+    MermaidConfig,
+    MermaidFormat,
+    MermaidTheme,
+    RuntimeMermaidConfig,
+)
+from md2pdf_pro.converter import probe_command, resolve_command
 from md2pdf_pro.errors import DependencyError, ErrorCode, MermaidError
 
 # Re-export errors for public API
@@ -22,12 +31,20 @@ MermaidRenderError = MermaidError
 
 logger = logging.getLogger(__name__)
 
-# Regex pattern for Mermaid code blocks
+# Regex pattern for Mermaid code blocks; find_mermaid_blocks() implements
+# the same match with plain string searches
 MERMAID_PATTERN = re.compile(
     r"```mermaid\s*\n(.*?)```",
     re.DOTALL | re.IGNORECASE,
 )
 
+_FENCE = "```"
+_MERMAID_TAG = "mermaid"
+
+# Documents with at least this many diagrams check the cache with a single
+# directory listing instead of one stat per diagram
+_LISTDIR_MIN_BLOCKS = 8
+
 # Supported diagram types
 SUPPORTED_DIAGRAMS = {
     "flowchart",
@@ -55,7 +72,7 @@ class MermaidPreprocessor:
     - Replacing code blocks with image references
     """
 
-    def __init__(self, config: MermaidConfig):
+    def __init__(self, config: MermaidConfig | RuntimeMermaidConfig):
         """Initialize Mermaid preprocessor.
 
         Args:
@@ -65,6 +82,11 @@ class MermaidPreprocessor:
         self._output_dir = config.output_dir
         self._output_dir.mkdir(parents=True, exist_ok=True)
         self._mmdc_available: bool | None = None
+        self._mmdc_path: str | None = resolve_command("mmdc")
+        self._probe_lock = asyncio.Lock()
+        self._render_slots = asyncio.Semaphore(
+            config.max_concurrent or os.cpu_count() or 1
+        )
 
     @property
     def output_dir(self) -> Path:
@@ -78,19 +100,27 @@ class MermaidPreprocessor:
             True if mmdc is installed and working
         """
         if self._mmdc_available is None:
-            try:
-                result = subprocess.run(
-                    ["mmdc", "--version"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-                self._mmdc_available = result.returncode == 0
-            except (FileNotFoundError, subprocess.TimeoutExpired):
-                self._mmdc_available = False
+            self._mmdc_path = probe_command("mmdc")[0]
+            self._mmdc_available = self._mmdc_path is not None
 
         return self._mmdc_available
 
+    async def _is_available_async(self) -> bool:
+        """Check mmdc availability without blocking the event loop.
+
+        The first check spawns ``mmdc --version``, so it runs in a worker
+        thread under a lock; later checks return the cached answer directly.
+
+        Returns:
+            True if mmdc is installed and working
+        """
+        if self._mmdc_available is None:
+            # Concurrent renders share one probe instead of racing to spawn
+            async with self._probe_lock:
+                if self._mmdc_available is None:
+                    await asyncio.to_thread(self.is_available)
+        return self.is_available()
+
     async def process(self, content: str, file_id: str) -> tuple[str, list[Path]]:
         """Process Mermaid code blocks in Markdown content.
 
@@ -101,74 +131,215 @@ class MermaidPreprocessor:
         Returns:
             Tuple of (processed content, list of generated diagram files)
         """
-        matches = list(MERMAID_PATTERN.finditer(content))
+        blocks = find_mermaid_blocks(content)
 
-        if not matches:
+        if not blocks:
             return content, []
 
+        # Reuse the whole result if this exact document was processed before
+        cache_file = self._document_cache_path(file_id)
+        source = hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+        cached = self._load_document_cache(cache_file, source)
+        if cached is not None:
+            return cached
+
+        # Diagrams are stored by content address, so identical diagrams are
+        # rendered once across documents and runs. With many diagrams, one
+        # directory listing beats a stat per diagram
+        existing = (
+            self._list_output_dir() if len(blocks) >= _LISTDIR_MIN_BLOCKS else None
+        )
+        ext = self.config.format.value
+        output_files: list[Path] = []
+        missing: list[tuple[int, bytes, Path]] = []
+        queued: set[str] = set()
+        for idx, block in enumerate(blocks):
+            # Encode once; the bytes are hashed and later piped to mmdc
+            code = block.code.encode("utf-8")
+            name = f"{diagram_digest(code, self.config)}.{ext}"
+            output_file = self._output_dir / name
+            output_files.append(output_file)
+            if name in queued:
+                continue
+            if existing is not None:
+                cached = name in existing
+            else:
+                cached = output_file.exists()
+            if not cached:
+                queued.add(name)
+                missing.append((idx, code, output_file))
+
+        # Render all missing diagrams in one mmdc run when there are several;
+        # anything the batch did not produce is rendered individually
+        if len(missing) > 1 and await self._is_available_async():
+            try:
+                await self._render_mermaid_batch(
+                    [(code, output_file) for _, code, output_file in missing]
+                )
+            except MermaidError as e:
+                logger.debug(f"Batch rendering failed, rendering singly: {e}")
+            missing = [item for item in missing if not item[2].exists()]
+
+        results = await asyncio.gather(
+            *(self._render_mermaid(code, path) for _, code, path in missing),
+            return_exceptions=True,
+        )
+        failed: set[Path] = set()
+        for (idx, _, output_file), result in zip(missing, results, strict=True):
+            if isinstance(result, MermaidError):
+                logger.warning(f"Failed to render Mermaid diagram {idx}: {result}")
+                failed.add(output_file)
+            elif isinstance(result, BaseException):
+                raise result
+
+        # Rebuild the document in one pass; failed diagrams keep their
+        # original code block
         generated_files: list[Path] = []
-        new_content = content
-        offset = 0
+        parts: list[str] = []
+        last_end = 0
+        for idx, block in enumerate(blocks):
+            parts.append(content[last_end : block.start])
+            if output_files[idx] in failed:
+                parts.append(content[block.start : block.end])
+            else:
+                generated_files.append(output_files[idx])
+                parts.append(self._image_ref(output_files[idx]))
+            last_end = block.end
+        parts.append(content[last_end:])
+        new_content = "".join(parts)
+
+        # Only cache complete results so failed diagrams are retried next time
+        if not failed:
+            self._save_document_cache(
+                cache_file, source, new_content, generated_files
+            )
 
-        for idx, match in enumerate(matches):
-            mermaid_code = match.group(1)
-            start_pos = match.start()
-            end_pos = match.end()
+        return new_content, generated_files
 
-            # Calculate content hash for caching
-            code_hash = compute_hash(mermaid_code)
+    def _list_output_dir(self) -> set[str]:
+        """List file names in the diagram output directory.
 
-            # Determine output file path
-            output_file = (
-                self._output_dir
-                / f"{file_id}_{idx}_{code_hash}.{self.config.format.value}"
-            )
+        Returns:
+            Set of entry names (empty if the directory cannot be read)
+        """
+        try:
+            return set(os.listdir(self._output_dir))
+        except OSError as e:
+            logger.debug(f"Cannot list {self._output_dir}: {e}")
+            return set()
 
-            # Render or get cached
-            try:
-                if not output_file.exists():
-                    await self._render_mermaid(mermaid_code, output_file)
-
-                generated_files.append(output_file)
-
-                # Replace code block with image reference
-                if self.config.format == MermaidFormat.PDF:
-                    # For PDF, use LaTeX includegraphics with properly escaped path
-                    # LaTeX requires forward slashes even on Windows
-                    latex_path = str(output_file).replace("\\", "/")
-                    image_ref = (
-                        f"\\includegraphics[width={{\\linewidth}}]{{{latex_path}}}\n\n"
-                    )
-                else:
-                    # For Markdown, use relative path if possible
-                    image_ref = f"![]({output_file})\n"
-
-                # Apply offset for next replacement
-                new_content = (
-                    new_content[: start_pos + offset]
-                    + image_ref
-                    + new_content[end_pos + offset :]
-                )
-                offset += len(image_ref) - (end_pos - start_pos)
+    def _image_ref(self, output_file: Path) -> str:
+        """Build the reference that replaces a rendered diagram.
 
-            except MermaidError as e:
-                logger.warning(f"Failed to render Mermaid diagram {idx}: {e}")
-                # Keep original code block on error
+        Args:
+            output_file: Rendered diagram path
 
-        return new_content, generated_files
+        Returns:
+            LaTeX includegraphics for PDF output, Markdown image otherwise
+        """
+        if self.config.format == MermaidFormat.PDF:
+            # For PDF, use LaTeX includegraphics with properly escaped path
+            # LaTeX requires forward slashes even on Windows
+            latex_path = str(output_file).replace("\\", "/")
+            return f"\\includegraphics[width={{\\linewidth}}]{{{latex_path}}}\n\n"
+        # For Markdown, use relative path if possible
+        return f"![]({output_file})\n"
+
+    def _document_cache_path(self, file_id: str) -> Path:
+        """Get the cache file path for a processed document.
+
+        Each file has one entry per set of render options, so a new version
+        of a document replaces the entry of the previous one.
+
+        Args:
+            file_id: Unique identifier for the file
+
+        Returns:
+            Path of the document cache entry
+        """
+        # Diagram names depend on the render options, so they are part of
+        # the key as well
+        config = self.config
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (
+            file_id,
+            config.theme.value,
+            str(config.width),
+            config.background,
+            config.format.value,
+        ):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return self._output_dir / f"{digest.hexdigest()}.cache"
+
+    def _load_document_cache(
+        self, cache_file: Path, source: str
+    ) -> tuple[str, list[Path]] | None:
+        """Load a cached processing result.
+
+        Args:
+            cache_file: Document cache entry path
+            source: Digest of the original Markdown content
+
+        Returns:
+            Tuple of (processed content, diagram files), or None on cache miss
+        """
+        try:
+            with open(cache_file, encoding="utf-8") as f:
+                data = json.load(f)
+            # The entry belongs to an earlier version of the document
+            if data["source"] != source:
+                return None
+            diagrams = [Path(p) for p in data["diagrams"]]
+            content = data["content"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug(f"Ignoring invalid document cache {cache_file}: {e}")
+            return None
+
+        # Diagrams may have been removed by clear_cache() or by hand
+        if not all(p.exists() for p in diagrams):
+            return None
+
+        return content, diagrams
+
+    def _save_document_cache(
+        self, cache_file: Path, source: str, content: str, diagrams: list[Path]
+    ) -> None:
+        """Store a processing result.
+
+        Args:
+            cache_file: Document cache entry path
+            source: Digest of the original Markdown content
+            content: Processed Markdown content
+            diagrams: Generated diagram files
+        """
+        data = {
+            "source": source,
+            "content": content,
+            "diagrams": [str(p) for p in diagrams],
+        }
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            tmp_file.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            logger.debug(f"Failed to write document cache {cache_file}: {e}")
+            tmp_file.unlink(missing_ok=True)
 
-    async def _render_mermaid(self, code: str, output_path: Path) -> None:
+    async def _render_mermaid(self, code: str | bytes, output_path: Path) -> None:
         """Render Mermaid code to PDF/SVG.
 
         Args:
-            code: Mermaid diagram code
+            code: Mermaid diagram code, as text or UTF-8 bytes
             output_path: Output file path
 
         Raises:
             DependencyError: If mmdc is not found
             MermaidError: If rendering fails
         """
-        if not self.is_available():
+        if not await self._is_available_async():
             raise DependencyError(
                 "mmdc command not found. Please install mermaid-cli: "
                 "npm install -g @mermaid-js/mermaid-cli",
@@ -176,60 +347,133 @@ class MermaidPreprocessor:
                 {"dependency": "mermaid-cli"},
             )
 
-        # Create temporary input file
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".mmd", delete=False, encoding="utf-8"
-        ) as input_file:
-            input_file.write(code)
-            input_path = Path(input_file.name)
+        # Feed the diagram on stdin instead of a temporary .mmd file
+        cmd = self._build_command("-", output_path)
+        await self._run_mmdc(
+            cmd,
+            timeout=60,
+            details={"output_path": str(output_path)},
+            input_data=code.encode("utf-8") if isinstance(code, str) else code,
+        )
+
+        if not output_path.exists():
+            raise MermaidError(
+                f"Output file not created: {output_path}",
+                ErrorCode.MERMAID_RENDER_ERROR,
+                {"output_path": str(output_path)},
+            )
 
-        try:
-            # Build command
-            cmd = self._build_command(input_path, output_path)
+    async def _render_mermaid_batch(self, diagrams: list[tuple[bytes, Path]]) -> None:
+        """Render several diagrams with a single mmdc run.
+
+        Uses mmdc's Markdown input mode, which renders every ``mermaid``
+        block of a document in one browser session and writes them as
+        numbered artifacts (``out-1.pdf``, ``out-2.pdf``, ...).
+
+        Args:
+            diagrams: (UTF-8 Mermaid code, output path) pairs
+
+        Raises:
+            MermaidError: If mmdc fails or an artifact is missing
+        """
+        ext = self.config.format.value
+        # Stage inside the output directory so artifacts can be renamed
+        # into place without crossing filesystems
+        with tempfile.TemporaryDirectory(dir=self._output_dir) as tmp:
+            tmp_dir = Path(tmp)
+            input_path = tmp_dir / "diagrams.md"
+            input_path.write_bytes(
+                b"".join(b"```mermaid\n" + code + b"\n```\n\n" for code, _ in diagrams)
+            )
+            cmd = self._build_command(input_path, tmp_dir / "out.md")
+            cmd.extend(["-e", ext])
 
-            # Execute
-            result = subprocess.run(
+            await self._run_mmdc(
                 cmd,
-                capture_output=True,
-                text=True,
-                timeout=60,
+                timeout=60 * len(diagrams),
+                details={"input_path": str(input_path)},
             )
 
-            if result.returncode != 0:
-                error_msg = result.stderr or result.stdout
+            for number, (_code, output_path) in enumerate(diagrams, start=1):
+                artifact = tmp_dir / f"out-{number}.{ext}"
+                if not artifact.exists():
+                    raise MermaidError(
+                        f"Output file not created: {artifact}",
+                        ErrorCode.MERMAID_RENDER_ERROR,
+                        {"output_path": str(output_path)},
+                    )
+                os.replace(artifact, output_path)
+
+    async def _run_mmdc(
+        self,
+        cmd: list[str],
+        timeout: float,
+        details: dict[str, Any],
+        input_data: bytes | None = None,
+    ) -> None:
+        """Run an mmdc command without blocking the event loop.
+
+        At most ``config.max_concurrent`` runs (default: CPU count) are in
+        flight per preprocessor, since each one starts a headless browser.
+
+        Args:
+            cmd: Command argument list
+            timeout: Timeout in seconds
+            details: Context added to raised errors
+            input_data: Optional bytes written to mmdc's stdin
+
+        Raises:
+            MermaidError: If mmdc cannot start, times out or fails
+        """
+        async with self._render_slots:
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdin=asyncio.subprocess.PIPE if input_data is not None else None,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+            except OSError as e:
                 raise MermaidError(
-                    f"Mermaid rendering failed: {error_msg}",
+                    f"Failed to start mmdc: {e}",
                     ErrorCode.MERMAID_RENDER_ERROR,
-                    {
-                        "input_path": str(input_path),
-                        "output_path": str(output_path),
-                        "error_code": result.returncode,
-                    },
+                    details,
+                    e,
                 )
 
-            if not output_path.exists():
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(input_data), timeout=timeout
+                )
+            except TimeoutError:
+                process.kill()
+                await process.wait()
                 raise MermaidError(
-                    f"Output file not created: {output_path}",
+                    "Mermaid rendering timed out",
                     ErrorCode.MERMAID_RENDER_ERROR,
-                    {"output_path": str(output_path)},
+                    {**details, "timeout": timeout},
                 )
 
-        finally:
-            # Clean up input file
-            input_path.unlink(missing_ok=True)
+        if process.returncode != 0:
+            error_msg = (stderr or stdout).decode(errors="replace")
+            raise MermaidError(
+                f"Mermaid rendering failed: {error_msg}",
+                ErrorCode.MERMAID_RENDER_ERROR,
+                {**details, "error_code": process.returncode},
+            )
 
-    def _build_command(self, input_path: Path, output_path: Path) -> list[str]:
+    def _build_command(self, input_path: Path | str, output_path: Path) -> list[str]:
         """Build mmdc command arguments.
 
         Args:
-            input_path: Input Mermaid file path
+            input_path: Input Mermaid file path, or ``"-"`` to read stdin
             output_path: Output file path
 
         Returns:
             Command argument list
         """
         cmd = [
-            "mmdc",
+            self._mmdc_path or "mmdc",
             "-i",
             str(input_path),
             "-o",
@@ -265,16 +509,97 @@ class MermaidPreprocessor:
         return count
 
 
-def compute_hash(content: str) -> str:
+def compute_hash(content: str | bytes) -> str:
     """Compute hash of content for caching.
 
+    The hash is only a cache key, so a 64-bit BLAKE2b digest is used
+    instead of truncating a full SHA-256.
+
+    Args:
+        content: Content to hash; text is hashed as UTF-8
+
+    Returns:
+        Hex digest of hash (16 characters)
+    """
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.blake2b(content, digest_size=8).hexdigest()
+
+
+def diagram_digest(code: bytes, config: MermaidConfig | RuntimeMermaidConfig) -> str:
+    """Compute the content address of a rendered diagram.
+
+    Covers the diagram code and every option that changes the rendered
+    output, so changing the theme or width never reuses a stale file.
+
+    Args:
+        code: UTF-8 Mermaid code
+        config: Mermaid configuration used for rendering
+
+    Returns:
+        Hex digest of hash (32 characters)
+    """
+    return hashlib.blake2b(
+        b"\0".join(
+            [
+                code,
+                config.theme.value.encode(),
+                str(config.width).encode(),
+                config.background.encode(),
+                config.format.value.encode(),
+            ]
+        ),
+        digest_size=16,
+    ).hexdigest()
+
+
+class MermaidBlock(NamedTuple):
+    """A fenced Mermaid code block located in a document."""
+
+    start: int
+    end: int
+    code: str
+
+
+def find_mermaid_blocks(content: str) -> list[MermaidBlock]:
+    """Locate fenced Mermaid code blocks.
+
+    Matches exactly what ``MERMAID_PATTERN.finditer`` matches, but uses
+    ``str.find`` to jump between fences instead of a lazy DOTALL regex.
+
     Args:
-        content: Content to hash
+        content: Markdown content
 
     Returns:
-        Hex digest of hash (first 16 characters)
+        Blocks in document order
     """
-    return hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+    blocks: list[MermaidBlock] = []
+    tag_len = len(_FENCE) + len(_MERMAID_TAG)
+    length = len(content)
+    pos = 0
+    while (start := content.find(_FENCE, pos)) != -1:
+        tag_end = start + tag_len
+        if content[start + len(_FENCE) : tag_end].lower() != _MERMAID_TAG:
+            pos = start + 1
+            continue
+
+        # The info string may be followed by whitespace; the code starts
+        # after the last newline in that run
+        ws_end = tag_end
+        while ws_end < length and content[ws_end].isspace():
+            ws_end += 1
+        newline = content.rfind("\n", tag_end, ws_end)
+        if newline == -1:
+            pos = start + 1
+            continue
+
+        close = content.find(_FENCE, newline + 1)
+        if close == -1:
+            break
+        end = close + len(_FENCE)
+        blocks.append(MermaidBlock(start, end, content[newline + 1 : close]))
+        pos = end
+    return blocks
 
 
 def diagram_line_matches(line: str, diagram_type: str) -> bool:
@@ -8,17 +8,132 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 import threading
-from collections.abc import Awaitable, Callable
-from dataclasses import dataclass
+import time
+from bisect import bisect_right
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from watchdog.events import (
+    FileCreatedEvent,
+    FileDeletedEvent,
+    FileModifiedEvent,
+    FileMovedEvent,
+    FileSystemEvent,
+    FileSystemEventHandler,
+)
 from watchdog.observers import Observer
 
 logger = logging.getLogger(__name__)
 
+# File suffixes (lowercase) treated as Markdown
+_MD_SUFFIXES: frozenset[str] = frozenset({".md", ".markdown"})
+
+# Event types the watcher reacts to. Passing them to the observer as an
+# event filter also narrows the inotify mask on Linux, so open, access and
+# close events are never read from the kernel
+_WATCHED_EVENTS: list[type[FileSystemEvent]] = [
+    FileCreatedEvent,
+    FileModifiedEvent,
+    FileDeletedEvent,
+    FileMovedEvent,
+]
+
+# Event paths whose filter result MarkdownEventHandler remembers
+_PASSES_CACHE_SIZE = 4096
+
+
+# Trie of characters; the empty-string key marks the end of a pattern
+_CharTrie = dict[str, "_CharTrie"]
+_TRIE_END = ""
+
+
+def _trie_insert(trie: _CharTrie, chars: Iterable[str]) -> None:
+    """Add a character sequence to a trie."""
+    node = trie
+    for ch in chars:
+        node = node.setdefault(ch, {})
+    node[_TRIE_END] = {}
+
+
+def _trie_has_prefix_of(trie: _CharTrie, chars: Iterable[str]) -> bool:
+    """Check whether any sequence in the trie is a prefix of ``chars``."""
+    node = trie
+    if _TRIE_END in node:
+        return True
+    for ch in chars:
+        child = node.get(ch)
+        if child is None:
+            return False
+        if _TRIE_END in child:
+            return True
+        node = child
+    return False
+
+
+class _IgnoreMatcher:
+    """Match file names against ignore patterns.
+
+    Supported patterns:
+    - ``.*`` / ``_*``: any hidden / underscore-prefixed name
+    - ``*suffix``: names ending with ``suffix``
+    - ``.prefix`` / ``_prefix``: names starting with the pattern
+    - anything else: the exact name
+
+    Prefixes live in a character trie and reversed suffixes in a sorted
+    list, so a name is checked with one trie descent and one binary search
+    however many patterns there are.
+    """
+
+    __slots__ = ("_exact", "_prefixes", "_suffixes")
+
+    def __init__(self, patterns: list[str]) -> None:
+        """Split patterns by kind.
+
+        Args:
+            patterns: Ignore patterns
+        """
+        exact: set[str] = set()
+        suffixes: list[str] = []
+        self._prefixes: _CharTrie = {}
+        for pattern in patterns:
+            if pattern in (".*", "_*"):
+                _trie_insert(self._prefixes, pattern[0])
+            elif pattern.startswith("*"):
+                suffixes.append(pattern[:0:-1])
+            elif pattern.startswith((".", "_")):
+                _trie_insert(self._prefixes, pattern)
+            else:
+                exact.add(pattern)
+        self._exact = frozenset(exact)
+
+        # Keep the reversed suffixes sorted and prefix-free: a suffix whose
+        # reversal extends a shorter one can never decide a match. Then the
+        # only candidate for a name is the entry just before it in order
+        self._suffixes: list[str] = []
+        for suffix in sorted(suffixes):
+            if not self._suffixes or not suffix.startswith(self._suffixes[-1]):
+                self._suffixes.append(suffix)
+
+    def _has_suffix(self, name: str) -> bool:
+        """Check if a name ends with one of the suffix patterns."""
+        reversed_name = name[::-1]
+        index = bisect_right(self._suffixes, reversed_name) - 1
+        return index >= 0 and reversed_name.startswith(self._suffixes[index])
+
+    def __call__(self, name: str) -> bool:
+        """Check if a file name is ignored."""
+        return (
+            name in self._exact
+            or _trie_has_prefix_of(self._prefixes, name)
+            or self._has_suffix(name)
+        )
+
 
 @dataclass
 class FileChange:
@@ -36,15 +151,22 @@ class MarkdownEventHandler(FileSystemEventHandler):
         self,
         callback: Callable[[FileChange], None],
         ignore_patterns: list[str] | None = None,
+        only_path: str | None = None,
     ):
         """Initialize event handler.
 
         Args:
             callback: Function to call on file changes
             ignore_patterns: Patterns to ignore
+            only_path: If set, events for any other path are dropped
         """
         self.callback = callback
         self.ignore_patterns = ignore_patterns or [".*", "_*"]
+        self.only_path = only_path
+        self._ignore = _IgnoreMatcher(self.ignore_patterns)
+        # The filter result depends only on the path, and one save produces
+        # several events for the same path
+        self._passes = lru_cache(maxsize=_PASSES_CACHE_SIZE)(self._markdown_path)
 
     def dispatch(self, event: FileSystemEvent) -> None:
         """Dispatch event to appropriate handler."""
@@ -59,90 +181,69 @@ class MarkdownEventHandler(FileSystemEventHandler):
 
     def _should_ignore(self, path: Path) -> bool:
         """Check if path should be ignored."""
-        name = path.name
-        for pattern in self.ignore_patterns:
-            if pattern == ".*":
-                # Match all hidden files/folders
-                if name.startswith("."):
-                    return True
-            elif pattern == "_*":
-                # Match all files/folders starting with underscore
-                if name.startswith("_"):
-                    return True
-            elif pattern.startswith("*"):
-                if name.endswith(pattern[1:]):
-                    return True
-            elif pattern.startswith("."):
-                if name.startswith(pattern):
-                    return True
-            elif pattern.startswith("_"):
-                if name.startswith(pattern):
-                    return True
-            elif name == pattern:
-                return True
-        return False
+        return self._ignore(path.name)
+
+    def _markdown_path(self, src_path: str | bytes) -> Path | None:
+        """Filter an event path down to a watched Markdown file.
+
+        Works on the raw string so rejected events (the bulk of them in
+        ``.git`` or ``node_modules``) never allocate a ``Path``.
+
+        Args:
+            src_path: Path reported by watchdog
+
+        Returns:
+            Path of the Markdown file, or None if the event is filtered out
+        """
+        src = os.fsdecode(src_path)
+        if self.only_path is not None and src != self.only_path:
+            return None
+        name = os.path.basename(src)
+        if self._ignore(name):
+            return None
+        # Same suffix rule as Path.suffix: a leading dot is not a suffix
+        dot = name.rfind(".")
+        if dot <= 0 or name[dot:].lower() not in _MD_SUFFIXES:
+            return None
+        return Path(src)
+
+    def _report(self, event_type: str, src_path: str | bytes) -> None:
+        """Filter a file event and pass it to the callback.
+
+        Args:
+            event_type: created, modified or deleted
+            src_path: Path reported by watchdog
+        """
+        path = self._passes(src_path)
+        if path is None:
+            return
+        self.callback(FileChange(event_type=event_type, path=path, is_directory=False))
 
     def on_created(self, event: FileSystemEvent) -> None:
         """Handle file creation."""
-        if event.is_directory:
-            return
-        path = Path(str(event.src_path))
-        if self._should_ignore(path):
-            return
-        if path.suffix.lower() in (".md", ".markdown"):
-            self.callback(
-                FileChange(event_type="created", path=path, is_directory=False)
-            )
+        if not event.is_directory:
+            self._report("created", event.src_path)
 
     def on_modified(self, event: FileSystemEvent) -> None:
         """Handle file modification."""
-        if event.is_directory:
-            return
-        path = Path(str(event.src_path))
-        if self._should_ignore(path):
-            return
-        if path.suffix.lower() in (".md", ".markdown"):
-            self.callback(
-                FileChange(event_type="modified", path=path, is_directory=False)
-            )
+        if not event.is_directory:
+            self._report("modified", event.src_path)
 
     def on_deleted(self, event: FileSystemEvent) -> None:
         """Handle file deletion."""
-        if event.is_directory:
-            return
-        path = Path(str(event.src_path))
-        if self._should_ignore(path):
-            return
-        if path.suffix.lower() in (".md", ".markdown"):
-            self.callback(
-                FileChange(event_type="deleted", path=path, is_directory=False)
-            )
+        if not event.is_directory:
+            self._report("deleted", event.src_path)
 
     def on_moved(self, event: FileSystemEvent) -> None:
         """Handle file move."""
         if event.is_directory:
             return
         # Treat moved files as deleted + created
-        src_path = Path(str(event.src_path))
 
         # Handle case where dest_path is None
         if hasattr(event, "dest_path") and event.dest_path:
-            dest_path = Path(str(event.dest_path))
-            if not self._should_ignore(dest_path):
-                if dest_path.suffix.lower() in (".md", ".markdown"):
-                    self.callback(
-                        FileChange(
-                            event_type="created", path=dest_path, is_directory=False
-                        )
-                    )
-
-            if not self._should_ignore(src_path):
-                if src_path.suffix.lower() in (".md", ".markdown"):
-                    self.callback(
-                        FileChange(
-                            event_type="deleted", path=src_path, is_directory=False
-                        )
-                    )
+            self._report("created", event.dest_path)
+            self._report("deleted", event.src_path)
 
 
 class FileWatcher:
@@ -185,7 +286,12 @@ class FileWatcher:
         ]
 
         self._observer: Any | None = None
-        self._pending_changes: dict[Path, threading.Thread] = {}
+        # Debounce state shared with the observer thread, guarded by _wake:
+        # path -> monotonic time at which its callback fires
+        self._deadlines: dict[Path, float] = {}
+        self._wake = threading.Condition()
+        self._stopping = False
+        self._debounce_thread: threading.Thread | None = None
 
     def start(self) -> None:
         """Start watching for file changes."""
@@ -193,22 +299,46 @@ class FileWatcher:
             logger.warning("Watcher already started")
             return
 
+        # A single file is watched through its parent directory without
+        # recursion, keeping only that file's events. Unlike a watch on the
+        # file itself, this survives editors that save by renaming a
+        # temporary file over the original
+        watch_dir = str(self.watch_path)
+        recursive = self.recursive
+        only_path: str | None = None
+        if self.watch_path.is_file():
+            watch_dir = str(self.watch_path.parent)
+            recursive = False
+            only_path = os.path.join(watch_dir, self.watch_path.name)
+
         # Create event handler
         handler = MarkdownEventHandler(
             callback=self._handle_change,
             ignore_patterns=self.ignore_patterns,
+            only_path=only_path,
         )
 
-        # Create and start observer
+        # Create and start observer. On Linux, watchdog's reader thread
+        # polls the inotify fd (level-triggered) and drains it with its
+        # default read buffer, so events are only lost when the kernel
+        # queue itself overflows (sysctl fs.inotify.max_queued_events)
         self._observer = Observer()
         self._observer.schedule(
             handler,
-            str(self.watch_path),
-            recursive=self.recursive,
+            watch_dir,
+            recursive=recursive,
+            event_filter=_WATCHED_EVENTS,
         )
         self._observer.start()
 
-        logger.info(f"Started watching: {self.watch_path}")
+        # One timer thread serves every path instead of one per event
+        self._stopping = False
+        self._debounce_thread = threading.Thread(
+            target=self._debounce_loop, name="md2pdf-debounce", daemon=True
+        )
+        self._debounce_thread.start()
+
+        logger.info("Started watching: %s", self.watch_path)
 
     def stop(self) -> None:
         """Stop watching for file changes."""
@@ -217,45 +347,114 @@ class FileWatcher:
             self._observer.join(timeout=5)
             self._observer = None
 
-            # Clear pending changes
-            self._pending_changes.clear()
+            # Drop pending changes and end the timer thread
+            with self._wake:
+                self._deadlines.clear()
+                self._stopping = True
+                self._wake.notify()
+            if self._debounce_thread is not None:
+                self._debounce_thread.join(timeout=5)
+                self._debounce_thread = None
 
-            logger.info(f"Stopped watching: {self.watch_path}")
+            logger.info("Stopped watching: %s", self.watch_path)
 
     def _handle_change(self, change: FileChange) -> None:
         """Handle file change with debouncing."""
         path = change.path.resolve()  # Normalize path
+        deadline = time.monotonic() + self.debounce_ms / 1000
+
+        with self._wake:
+            # Deadlines only move forward, so the timer thread needs waking
+            # only when it is idle
+            if not self._deadlines:
+                self._wake.notify()
+            # Every event pushes the path's deadline back, so the create and
+            # modify storm of one save fires once, after the last write.
+            # Re-inserting keeps the dict ordered by deadline
+            self._deadlines.pop(path, None)
+            self._deadlines[path] = deadline
+
+    def _debounce_loop(self) -> None:
+        """Fire callbacks for paths whose debounce deadline has passed."""
+        with self._wake:
+            while not self._stopping:
+                now = time.monotonic()
+                ready: list[Path] = []
+                for path, deadline in self._deadlines.items():
+                    if deadline > now:
+                        break
+                    ready.append(path)
+                if not ready:
+                    # The first entry holds the earliest deadline
+                    timeout = (
+                        next(iter(self._deadlines.values())) - now
+                        if self._deadlines
+                        else None
+                    )
+                    self._wake.wait(timeout)
+                    continue
 
-        # Remove existing pending task for this path
-        if path in self._pending_changes:
-            self._pending_changes.pop(path)
-
-        # Schedule new debounced callback
-        def debounced_callback() -> None:
-            import time
-
-            time.sleep(self.debounce_ms / 1000)
-            if path not in self._pending_changes:
-                self.callback([path])
-
-        thread = threading.Thread(target=debounced_callback)
-        thread.daemon = True
-        thread.start()
+                for path in ready:
+                    del self._deadlines[path]
 
-        # Store thread reference
-        self._pending_changes[path] = thread
+                # One callback per tick with every expired path; run it
+                # without holding the lock so events keep flowing
+                self._wake.release()
+                try:
+                    self.callback(ready)
+                except Exception as e:
+                    logger.error(
+                        "Watch callback failed for %d files: %s", len(ready), e
+                    )
+                finally:
+                    self._wake.acquire()
 
     def is_running(self) -> bool:
         """Check if watcher is running."""
         return self._observer is not None and self._observer.is_alive()
 
 
+@dataclass(slots=True)
+class _WatchNode:
+    """Node of the path trie used by WatchManager."""
+
+    children: dict[str, _WatchNode] = field(default_factory=dict)
+    watcher: FileWatcher | None = None
+
+
 class WatchManager:
-    """Manager for multiple file watchers."""
+    """Manager for multiple file watchers.
+
+    Watches are kept in a trie of resolved path components. A watch below
+    a running recursive watch with the same callback and settings would
+    only duplicate its events, so it is registered but not started; it is
+    started again as soon as no running watch covers it any more.
+    """
 
     def __init__(self) -> None:
         """Initialize watch manager."""
         self._watchers: dict[Path, FileWatcher] = {}
+        self._root = _WatchNode()
+        self._resolve_cache: dict[Path, Path] = {}
+
+    def _resolve(self, path: Path) -> Path:
+        """Resolve a path, reusing earlier resolutions of the same input.
+
+        Only absolute inputs are cached, since a relative path resolves
+        differently once the working directory changes.
+
+        Args:
+            path: Path as given by the caller
+
+        Returns:
+            Absolute path with symlinks resolved
+        """
+        if not path.is_absolute():
+            return path.resolve()
+        resolved = self._resolve_cache.get(path)
+        if resolved is None:
+            resolved = self._resolve_cache[path] = path.resolve()
+        return resolved
 
     def add_watch(
         self,
@@ -264,6 +463,7 @@ class WatchManager:
         *,
         recursive: bool = True,
         debounce_ms: int = 500,
+        ignore_patterns: list[str] | None = None,
     ) -> None:
         """Add a watch for a path.
 
@@ -272,11 +472,12 @@ class WatchManager:
             callback: Callback function
             recursive: Watch subdirectories
             debounce_ms: Debounce delay
+            ignore_patterns: Patterns to ignore (FileWatcher defaults if None)
         """
-        path = path.resolve()
+        path = self._resolve(path)
 
         if path in self._watchers:
-            logger.warning(f"Path already being watched: {path}")
+            logger.warning("Path already being watched: %s", path)
             return
 
         watcher = FileWatcher(
@@ -284,31 +485,140 @@ class WatchManager:
             callback=callback,
             recursive=recursive,
             debounce_ms=debounce_ms,
+            ignore_patterns=ignore_patterns,
         )
-        watcher.start()
+        node = self._root
+        for part in path.parts:
+            node = node.children.setdefault(part, _WatchNode())
+        node.watcher = watcher
         self._watchers[path] = watcher
 
+        cover = self._find_cover(path, watcher)
+        if cover is not None:
+            logger.debug("Path already covered by %s: %s", cover.watch_path, path)
+            return
+
+        watcher.start()
+
+        # Running watches below that this one covers are paused, not removed
+        for nested in self._nested_watchers(node):
+            if nested.is_running() and self._covers(watcher, nested):
+                logger.debug("Pausing covered watch: %s", nested.watch_path)
+                nested.stop()
+
     def remove_watch(self, path: Path) -> None:
         """Remove a watch.
 
+        Watches that were paused because this one covered them are started
+        again unless another running watch still covers them.
+
         Args:
             path: Path to stop watching
         """
-        path = path.resolve()
+        path = self._resolve(path)
 
-        if path in self._watchers:
-            self._watchers[path].stop()
-            del self._watchers[path]
+        watcher = self._watchers.pop(path, None)
+        if watcher is None:
+            return
+        was_running = watcher.is_running()
+        watcher.stop()
+
+        trail = [self._root]
+        for part in path.parts:
+            trail.append(trail[-1].children[part])
+        node = trail[-1]
+        node.watcher = None
+
+        if was_running:
+            # Parents come before children, so a restarted watch covers
+            # its own descendants before they are considered
+            for nested in self._nested_watchers(node):
+                if not nested.is_running() and (
+                    self._find_cover(nested.watch_path, nested) is None
+                ):
+                    logger.debug("Resuming uncovered watch: %s", nested.watch_path)
+                    nested.start()
+
+        # Prune branches left without watches
+        for parent, part in zip(
+            reversed(trail[:-1]), reversed(path.parts), strict=True
+        ):
+            child = parent.children[part]
+            if child.watcher is not None or child.children:
+                break
+            del parent.children[part]
+
+    def _find_cover(self, path: Path, watcher: FileWatcher) -> FileWatcher | None:
+        """Find a running watch on an ancestor that covers a watch.
+
+        Args:
+            path: Resolved path of the watch
+            watcher: Watch to check
+
+        Returns:
+            The covering watcher, or None
+        """
+        node = self._root
+        for part in path.parts[:-1]:
+            child = node.children.get(part)
+            if child is None:
+                return None
+            node = child
+            cover = node.watcher
+            if cover is not None and cover.is_running():
+                if self._covers(cover, watcher):
+                    return cover
+        return None
+
+    @staticmethod
+    def _covers(cover: FileWatcher, watcher: FileWatcher) -> bool:
+        """Check whether a watch on an ancestor delivers all of a watch's events.
+
+        Args:
+            cover: Watch on an ancestor path
+            watcher: Watch below it
+
+        Returns:
+            True if both watch recursively with the same callback, debounce
+            delay and ignore patterns
+        """
+        return (
+            cover.recursive
+            and watcher.recursive
+            and cover.callback == watcher.callback
+            and cover.debounce_ms == watcher.debounce_ms
+            and cover.ignore_patterns == watcher.ignore_patterns
+        )
+
+    @staticmethod
+    def _nested_watchers(node: _WatchNode) -> list[FileWatcher]:
+        """Collect watchers strictly below a trie node, shallowest first.
+
+        Args:
+            node: Trie node
+
+        Returns:
+            Watchers of all descendant nodes in breadth-first order
+        """
+        found: list[FileWatcher] = []
+        queue = deque(node.children.values())
+        while queue:
+            current = queue.popleft()
+            if current.watcher is not None:
+                found.append(current.watcher)
+            queue.extend(current.children.values())
+        return found
 
     def remove_all(self) -> None:
         """Remove all watches."""
         for watcher in self._watchers.values():
             watcher.stop()
         self._watchers.clear()
+        self._root = _WatchNode()
 
     @property
     def watchers(self) -> dict[Path, FileWatcher]:
-        """Get all active watchers."""
+        """Get all registered watchers, including paused covered ones."""
         return self._watchers.copy()
 
 
@@ -330,6 +640,7 @@ async def watch_and_convert(
     *,
     recursive: bool = True,
     debounce_ms: int = 500,
+    max_workers: int = 4,
 ) -> None:
     """Watch directory and convert files on change.
 
@@ -338,35 +649,55 @@ async def watch_and_convert(
         convert_fn: Async conversion function
         recursive: Watch subdirectories
         debounce_ms: Debounce delay
+        max_workers: Maximum number of concurrent conversions
     """
-    pending: set[Path] = set()
-
-    async def process_pending() -> None:
-        while pending:
-            files = list(pending)
+    loop = asyncio.get_running_loop()
+    # Insertion-ordered set of changed paths, keyed by str(path): strings
+    # hash once and cheaply, a Path is only rebuilt when the file is converted
+    pending: dict[str, None] = {}
+    slots = asyncio.Semaphore(max_workers)
+    # Changes arrive on the watcher's timer thread; they are queued here and
+    # handed to the loop with one call_soon_threadsafe per burst
+    inbox: deque[Path] = deque()
+    inbox_lock = threading.Lock()
+    wake_scheduled = False
+    trigger = asyncio.Event()
+
+    async def worker() -> None:
+        # The only consumer of pending, so no batch is converted twice;
+        # changes arriving mid-batch are picked up by the next round
+        while True:
+            await trigger.wait()
+            trigger.clear()
+            files = [Path(file) for file in pending]
             pending.clear()
 
-            for file in files:
-                try:
-                    await convert_fn(file)
-                    logger.info(f"Converted: {file}")
-                except Exception as e:
-                    logger.error(f"Failed to convert {file}: {e}")
+            await asyncio.gather(*(convert(file) for file in files))
+
+    async def convert(file: Path) -> None:
+        async with slots:
+            try:
+                await convert_fn(file)
+                logger.info("Converted: %s", file)
+            except Exception as e:
+                logger.error("Failed to convert %s: %s", file, e)
+
+    def drain() -> None:
+        nonlocal wake_scheduled
+        with inbox_lock:
+            wake_scheduled = False
+        while inbox:
+            pending[str(inbox.popleft())] = None
+        trigger.set()
 
     def on_change(changes: list[Path]) -> None:
-        for change in changes:
-            pending.add(change)
-
-        # Schedule processing
-        try:
-            loop = asyncio.get_running_loop()
-            loop.create_task(process_pending())
-        except RuntimeError:
-            # No running loop, create a new one
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(process_pending())
-            loop.close()
+        nonlocal wake_scheduled
+        inbox.extend(changes)
+        with inbox_lock:
+            if wake_scheduled:
+                return
+            wake_scheduled = True
+        loop.call_soon_threadsafe(drain)
 
     manager = get_watch_manager()
     manager.add_watch(
@@ -377,9 +708,8 @@ async def watch_and_convert(
     )
 
     try:
-        # Keep running
-        while True:
-            await asyncio.sleep(1)
+        # Runs until cancelled; cancelling this coroutine cancels the worker
+        await loop.create_task(worker())
     except asyncio.CancelledError:
         manager.remove_all()
         raise
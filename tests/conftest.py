@@ -2,27 +2,16 @@
 
 from __future__ import annotations
 
-import os
 import tempfile
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any
 
 import pytest
 
-# Set test environment
-os.environ["MD2PDF_TESTING"] = "1"
-
-
-@pytest.fixture
-def temp_dir() -> Path:
-    """Create a temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
-
-
-@pytest.fixture
-def sample_markdown() -> str:
-    """Sample Markdown content."""
-    return """# Test Document
+# Shared fixture values, built once at import
+SAMPLE_MARKDOWN = """# Test Document
 
 This is a test document with some content.
 
@@ -50,11 +39,7 @@ $$
 - Item 3
 """
 
-
-@pytest.fixture
-def sample_markdown_with_mermaid() -> str:
-    """Sample Markdown with Mermaid diagram."""
-    return """# Test with Mermaid
+SAMPLE_MARKDOWN_WITH_MERMAID = """# Test with Mermaid
 
 ## Flowchart
 
@@ -78,27 +63,79 @@ sequenceDiagram
 ```
 """
 
+# Read-only so the session-scoped fixture cannot leak changes between tests
+CONFIG_DICT: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {
+        "mermaid": MappingProxyType(
+            {
+                "theme": "default",
+                "format": "pdf",
+                "width": 1200,
+                "background": "white",
+            }
+        ),
+        "pandoc": MappingProxyType(
+            {
+                "pdf_engine": "tectonic",
+                "highlight_style": "tango",
+            }
+        ),
+        "processing": MappingProxyType(
+            {
+                "max_workers": 4,
+                "timeout": 60,
+            }
+        ),
+        "output": MappingProxyType(
+            {
+                "output_dir": "./output",
+                "temp_dir": "/tmp/md2pdf_test",
+            }
+        ),
+    }
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def testing_env():
+    """Set the test environment once per session and restore it afterwards."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("MD2PDF_TESTING", "1")
+        yield
+
+
+@pytest.fixture(autouse=True)
+def clear_probe_cache():
+    """Forget cached dependency probes so mocks apply per test."""
+    from md2pdf_pro.converter import probe_command, resolve_command
+
+    probe_command.cache_clear()
+    resolve_command.cache_clear()
+    yield
+    probe_command.cache_clear()
+    resolve_command.cache_clear()
+
 
 @pytest.fixture
-def config_dict() -> dict:
-    """Sample configuration dictionary."""
-    return {
-        "mermaid": {
-            "theme": "default",
-            "format": "pdf",
-            "width": 1200,
-            "background": "white",
-        },
-        "pandoc": {
-            "pdf_engine": "tectonic",
-            "highlight_style": "tango",
-        },
-        "processing": {
-            "max_workers": 4,
-            "timeout": 60,
-        },
-        "output": {
-            "output_dir": "./output",
-            "temp_dir": "/tmp/md2pdf_test",
-        },
-    }
+def temp_dir() -> Path:
+    """Create a temporary directory for tests."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+@pytest.fixture(scope="session")
+def sample_markdown() -> str:
+    """Sample Markdown content."""
+    return SAMPLE_MARKDOWN
+
+
+@pytest.fixture(scope="session")
+def sample_markdown_with_mermaid() -> str:
+    """Sample Markdown with Mermaid diagram."""
+    return SAMPLE_MARKDOWN_WITH_MERMAID
+
+
+@pytest.fixture(scope="session")
+def config_dict() -> Mapping[str, Mapping[str, Any]]:
+    """Sample configuration dictionary (read-only)."""
+    return CONFIG_DICT
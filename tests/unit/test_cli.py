@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import os
+import subprocess
+import sys
 import tempfile
 from pathlib import Path
 
@@ -44,6 +46,52 @@ def test_version(runner):
     assert "MD2PDF Pro v" in result.output
 
 
+def test_version_skips_converter_imports():
+    """Test --version does not import the conversion stack."""
+    code = (
+        "import sys\n"
+        "from typer.testing import CliRunner\n"
+        "from md2pdf_pro.cli import app\n"
+        "CliRunner().invoke(app, ['--version'])\n"
+        "heavy = ['md2pdf_pro.converter', 'md2pdf_pro.parallel',"
+        " 'md2pdf_pro.preprocessor']\n"
+        "print(','.join(m for m in heavy if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_import_does_not_touch_console_or_logging():
+    """Test importing the CLI neither builds a console nor configures logging."""
+    code = (
+        "import logging\n"
+        "from md2pdf_pro import cli\n"
+        "print(cli._console.cache_info().currsize, len(logging.getLogger().handlers))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split() == ["0", "0"]
+
+
+def test_run_uses_event_loop_factory(mocker):
+    """Test _run executes coroutines on the configured loop factory."""
+    import asyncio
+
+    from md2pdf_pro import cli
+
+    factory = mocker.Mock(side_effect=asyncio.new_event_loop)
+    mocker.patch.object(cli, "_event_loop_factory", return_value=factory)
+
+    async def answer() -> int:
+        return 42
+
+    assert cli._run(answer()) == 42
+    factory.assert_called_once()
+
+
 def test_init(runner, test_dir):
     """Test init command."""
     config_path = test_dir / "md2pdf.yaml"
@@ -135,6 +183,123 @@ def test_find_files():
             os.chdir(original_cwd)
 
 
+def test_find_files_prunes_ignored_dirs(tmp_path, monkeypatch):
+    """Test _find_files does not descend into ignored directories."""
+    from md2pdf_pro.cli import _find_files
+
+    (tmp_path / "keep.md").write_text("# Keep", encoding="utf-8")
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "skip.md").write_text("# Skip", encoding="utf-8")
+    # Name prefixes apply to files only, not to the directories holding them
+    for dirname in (".github", "_build", "docs/.hidden"):
+        (tmp_path / dirname).mkdir(parents=True)
+        (tmp_path / dirname / "doc.md").write_text("# Doc", encoding="utf-8")
+        (tmp_path / dirname / "_draft.md").write_text("# Draft", encoding="utf-8")
+
+    scanned: list[str] = []
+    real_scandir = os.scandir
+
+    def tracking_scandir(path):
+        scanned.append(os.path.normpath(path))
+        return real_scandir(path)
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr("md2pdf_pro.cli.os.scandir", tracking_scandir)
+
+    files = _find_files("*.md", True, [".*", "_*", "node_modules"])
+
+    assert files == [
+        Path(".github/doc.md"),
+        Path("_build/doc.md"),
+        Path("docs/.hidden/doc.md"),
+        Path("keep.md"),
+    ]
+    assert "node_modules" not in scanned
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="symlinks need privileges")
+def test_find_files_dedupes_links(tmp_path, monkeypatch):
+    """Test _find_files returns a file reached through a symlink only once."""
+    from md2pdf_pro.cli import _find_files
+
+    (tmp_path / "doc.md").write_text("# Doc", encoding="utf-8")
+    (tmp_path / "alias.md").symlink_to(tmp_path / "doc.md")
+    (tmp_path / "other.md").write_text("# Other", encoding="utf-8")
+
+    monkeypatch.chdir(tmp_path)
+    files = _find_files("*.md", False, None)
+
+    assert len(files) == 2
+    assert Path("other.md") in files
+    assert len({f.resolve() for f in files}) == 2
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="inodes come from stat")
+def test_find_files_dedupes_hardlinks_without_stat(tmp_path, monkeypatch, mocker):
+    """Test hardlinks are deduped without stat'ing each matched file."""
+    import os
+
+    from md2pdf_pro.cli import _find_files
+
+    (tmp_path / "doc.md").write_text("# Doc", encoding="utf-8")
+    os.link(tmp_path / "doc.md", tmp_path / "copy.md")
+    (tmp_path / "other.md").write_text("# Other", encoding="utf-8")
+
+    monkeypatch.chdir(tmp_path)
+    stat = mocker.spy(os, "stat")
+    files = _find_files("*.md", False, None)
+
+    assert len(files) == 2
+    assert Path("other.md") in files
+    assert not [c for c in stat.call_args_list if str(c.args[0]).endswith(".md")]
+
+
+def test_compile_pattern():
+    """Test _compile_pattern glob matching and caching."""
+    from md2pdf_pro.cli import _compile_pattern
+
+    pattern = _compile_pattern("test?.md")
+    assert pattern.match("test1.md")
+    assert not pattern.match("test10.md")
+    assert not pattern.match("other.md")
+    assert _compile_pattern("test?.md") is pattern
+
+
+def test_read_text_fast(tmp_path):
+    """Test _read_text_fast matches Path.read_text."""
+    from md2pdf_pro.cli import _read_text_fast
+
+    path = tmp_path / "doc.md"
+    for text in ("", "# Título\r\nLine\rEnd", "x" * 100_000):
+        path.write_bytes(text.encode("utf-8"))
+        assert _read_text_fast(path) == path.read_text(encoding="utf-8")
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="needs os.mkfifo")
+def test_read_text_fast_reads_pipe_to_eof(tmp_path):
+    """Test _read_text_fast keeps reading a pipe after a short read."""
+    import threading
+    import time
+
+    from md2pdf_pro.cli import _read_text_fast
+
+    fifo = tmp_path / "doc.md"
+    os.mkfifo(fifo)
+
+    def write_parts():
+        with open(fifo, "wb", buffering=0) as f:
+            f.write(b"# part1\n")
+            time.sleep(0.05)
+            f.write(b"part2\n")
+
+    writer = threading.Thread(target=write_parts)
+    writer.start()
+    try:
+        assert _read_text_fast(fifo) == "# part1\npart2\n"
+    finally:
+        writer.join()
+
+
 def test_should_process():
     """Test _should_process function."""
     from md2pdf_pro.cli import _should_process
@@ -188,3 +353,108 @@ def test_watch_command(runner, test_dir):
     )
     # Note: This will fail in test environment, but we're testing CLI parsing
     assert result.exit_code != 0
+
+
+async def test_convert_batch_shares_components(mocker, test_dir):
+    """Test _convert_batch builds the preprocessor and engine once."""
+    from md2pdf_pro.cli import _convert_batch
+
+    mermaid_cls = mocker.patch("md2pdf_pro.preprocessor.MermaidPreprocessor")
+    mermaid_cls.return_value.process = mocker.AsyncMock(
+        side_effect=lambda content, file_id: (content, [])
+    )
+    engine_cls = mocker.patch("md2pdf_pro.converter.PandocEngine")
+    engine_cls.return_value.convert_bytes = mocker.AsyncMock(return_value=b"%PDF")
+
+    config = ProjectConfig()
+    config.output.output_dir = test_dir / "output"
+    config.output.temp_dir = test_dir / "tmp"
+    files = [test_dir / "test1.md", test_dir / "test2.md"]
+
+    results = await _convert_batch(files, config.to_runtime())
+
+    assert results.success == 2
+    assert mermaid_cls.call_count == 1
+    assert engine_cls.call_count == 1
+    assert engine_cls.return_value.convert_bytes.await_count == 2
+    assert (test_dir / "output" / "test1.pdf").read_bytes() == b"%PDF"
+    assert config.output.temp_dir.is_dir()
+
+
+async def test_convert_book_single_pandoc_run(mocker, test_dir):
+    """Test _convert_book preprocesses each file and runs pandoc once."""
+    from md2pdf_pro.cli import _convert_book
+
+    mermaid_cls = mocker.patch("md2pdf_pro.preprocessor.MermaidPreprocessor")
+    mermaid_cls.return_value.process = mocker.AsyncMock(
+        side_effect=lambda content, file_id: (content, [])
+    )
+    engine_cls = mocker.patch("md2pdf_pro.converter.PandocEngine")
+    seen: list[str] = []
+
+    async def convert_many(inputs, output_file):
+        seen.extend(p.read_text(encoding="utf-8") for p in inputs)
+        return mocker.Mock(success=True)
+
+    engine_cls.return_value.convert_many = mocker.AsyncMock(side_effect=convert_many)
+
+    config = ProjectConfig()
+    config.output.temp_dir = test_dir / "tmp"
+    files = [test_dir / "test1.md", test_dir / "test2.md"]
+
+    await _convert_book(files, test_dir / "book.pdf", config.to_runtime())
+
+    assert engine_cls.return_value.convert_many.await_count == 1
+    assert seen == [f.read_text(encoding="utf-8") for f in files]
+    assert not list((test_dir / "tmp").iterdir())
+
+
+async def test_convert_book_cleans_up_when_prepare_fails(mocker, test_dir):
+    """Test _convert_book removes the files already written when one fails."""
+    from md2pdf_pro.cli import _convert_book
+    from md2pdf_pro.errors import DependencyError, ErrorCode
+
+    async def process(content, file_id):
+        if file_id == "test2":
+            raise DependencyError("mmdc not found", ErrorCode.DEPENDENCY_MISSING)
+        return content, []
+
+    mermaid_cls = mocker.patch("md2pdf_pro.preprocessor.MermaidPreprocessor")
+    mermaid_cls.return_value.process = mocker.AsyncMock(side_effect=process)
+    engine_cls = mocker.patch("md2pdf_pro.converter.PandocEngine")
+    engine_cls.return_value.convert_many = mocker.AsyncMock()
+
+    config = ProjectConfig()
+    config.output.temp_dir = test_dir / "tmp"
+    files = [test_dir / "test1.md", test_dir / "test2.md"]
+
+    with pytest.raises(DependencyError):
+        await _convert_book(files, test_dir / "book.pdf", config.to_runtime())
+
+    engine_cls.return_value.convert_many.assert_not_awaited()
+    assert not list((test_dir / "tmp").iterdir())
+
+
+async def test_convert_single_reuses_components(mocker, test_dir):
+    """Test _convert_single uses passed-in components instead of building new ones."""
+    from md2pdf_pro.cli import _convert_single
+
+    mermaid_cls = mocker.patch("md2pdf_pro.preprocessor.MermaidPreprocessor")
+    engine_cls = mocker.patch("md2pdf_pro.converter.PandocEngine")
+    mermaid = mocker.Mock()
+    mermaid.process = mocker.AsyncMock(return_value=("# Test 1", []))
+    engine = mocker.Mock()
+    engine.convert_bytes = mocker.AsyncMock(return_value=b"%PDF")
+
+    config = ProjectConfig()
+    config.output.temp_dir = test_dir / "tmp"
+    runtime = config.to_runtime()
+
+    for _ in range(2):
+        await _convert_single(
+            test_dir / "test1.md", test_dir / "test1.pdf", runtime, mermaid, engine
+        )
+
+    mermaid_cls.assert_not_called()
+    engine_cls.assert_not_called()
+    assert engine.convert_bytes.await_count == 2
@@ -22,6 +22,7 @@ from md2pdf_pro.config import (
     get_default_config_path,
     init_config,
 )
+from md2pdf_pro.errors import ConfigError, ErrorCode
 
 
 def test_project_config_defaults():
@@ -87,6 +88,64 @@ def test_project_config_to_yaml(temp_dir):
     assert loaded_config.processing.max_workers == 6
 
 
+def test_project_config_from_yaml_cached(temp_dir):
+    """Test repeated YAML loads reuse the parsed config until the file changes."""
+    config_path = temp_dir / "config.yaml"
+    config_path.write_text("processing:\n  max_workers: 4\n", encoding="utf-8")
+
+    first = ProjectConfig.from_yaml(config_path)
+    second = ProjectConfig.from_yaml(config_path)
+
+    # Each call returns an independent copy that is safe to mutate
+    assert first == second
+    assert first is not second
+    first.processing.max_workers = 2
+    assert ProjectConfig.from_yaml(config_path).processing.max_workers == 4
+
+    # Changing the file invalidates the cached entry
+    config_path.write_text("processing:\n  max_workers: 16\n", encoding="utf-8")
+    assert ProjectConfig.from_yaml(config_path).processing.max_workers == 16
+
+
+def test_project_config_from_json_shaped_file(temp_dir):
+    """Test JSON configs and YAML flow mappings both load."""
+    json_path = temp_dir / "config.json"
+    json_path.write_text(
+        '  {"mermaid": {"theme": "dark"}, "processing": {"max_workers": 3}}',
+        encoding="utf-8",
+    )
+    config = ProjectConfig.from_yaml(json_path)
+    assert config.mermaid.theme == MermaidTheme.DARK
+    assert config.processing.max_workers == 3
+
+    # Not valid JSON, but valid YAML
+    flow_path = temp_dir / "flow.yaml"
+    flow_path.write_text("{processing: {max_workers: 5}}", encoding="utf-8")
+    assert ProjectConfig.from_yaml(flow_path).processing.max_workers == 5
+
+
+def test_project_config_from_yaml_missing(temp_dir):
+    """Test loading a missing YAML file raises ConfigError."""
+    with pytest.raises(ConfigError) as exc_info:
+        ProjectConfig.from_yaml(temp_dir / "missing.yaml")
+    assert exc_info.value.error_code == ErrorCode.CONFIG_NOT_FOUND
+
+
+def test_project_config_to_yaml_plain_values(temp_dir):
+    """Test paths and enums are written as plain YAML strings."""
+    config = ProjectConfig()
+    config.pandoc.template = Path("templates/custom.latex")
+    config.mermaid.theme = MermaidTheme.DARK
+
+    config_path = temp_dir / "plain.yaml"
+    config.to_yaml(config_path)
+
+    text = config_path.read_text(encoding="utf-8")
+    assert "!!" not in text
+    assert "template: templates/custom.latex" in text
+    assert "theme: dark" in text
+
+
 def test_project_config_from_env():
     """Test loading configuration from environment variables."""
     # Set environment variables
@@ -113,6 +172,20 @@ def test_project_config_from_env():
                 del os.environ[key]
 
 
+def test_project_config_from_env_partial(monkeypatch):
+    """Test unset environment variables keep their defaults."""
+    for key in ("MD2PDF_PDF_ENGINE", "MD2PDF_OUTPUT_DIR", "MD2PDF_LOG_LEVEL"):
+        monkeypatch.delenv(key, raising=False)
+    monkeypatch.setenv("MD2PDF_MAX_WORKERS", "3")
+
+    config = ProjectConfig.from_env()
+
+    assert config.processing.max_workers == 3
+    assert config.processing.timeout == 300
+    assert config.pandoc.pdf_engine == PdfEngine.TECTONIC
+    assert config.logging.level == LogLevel.INFO
+
+
 def test_project_config_merge_with_args():
     """Test merging configuration with command-line arguments."""
     config = ProjectConfig()
@@ -132,6 +205,35 @@ def test_project_config_merge_with_args():
     assert merged_config.pandoc.template == Path("./template.tex")
     assert merged_config.mermaid.theme == MermaidTheme.FOREST
 
+    # The original config is left untouched
+    assert config.pandoc.pdf_engine == PdfEngine.TECTONIC
+    assert config.processing.max_workers == 8
+    assert config.mermaid.theme == MermaidTheme.DEFAULT
+
+
+def test_project_config_with_overrides():
+    """Test applying nested overrides in a single copy."""
+    config = ProjectConfig()
+
+    updated = config.with_overrides(
+        {
+            "processing": {"max_workers": 2},
+            "pdf": {"metadata": {"author": "Alice"}, "watermark": {}},
+            "version": "2.0.0",
+        }
+    )
+
+    assert updated.processing.max_workers == 2
+    assert updated.pdf.metadata.author == "Alice"
+    assert updated.version == "2.0.0"
+    # Original is untouched
+    assert config.processing.max_workers == 8
+    assert config.pdf.metadata.author == ""
+    assert config.version == "1.0.1"
+    # Untouched sub-configurations are shared rather than copied
+    assert updated.font is config.font
+    assert updated.pdf.watermark is config.pdf.watermark
+
 
 def test_get_default_config_path():
     """Test get_default_config_path function."""
@@ -140,6 +242,27 @@ def test_get_default_config_path():
     assert path.name in ["md2pdf.yaml", ".md2pdf.yaml"]
 
 
+def test_get_default_config_path_prefers_cwd(temp_dir, monkeypatch):
+    """Test get_default_config_path picks up config files in the cwd."""
+    monkeypatch.chdir(temp_dir)
+    assert get_default_config_path() == temp_dir / "md2pdf.yaml"
+
+    (temp_dir / ".md2pdf.yaml").write_text("{}", encoding="utf-8")
+    assert get_default_config_path() == temp_dir / ".md2pdf.yaml"
+
+    (temp_dir / "md2pdf.yaml").write_text("{}", encoding="utf-8")
+    assert get_default_config_path() == temp_dir / "md2pdf.yaml"
+
+
+def test_get_default_config_path_skips_directories(temp_dir, monkeypatch):
+    """Test a directory named like a config file is not picked up."""
+    monkeypatch.chdir(temp_dir)
+    (temp_dir / "md2pdf.yaml").mkdir()
+    (temp_dir / ".md2pdf.yaml").write_text("{}", encoding="utf-8")
+
+    assert get_default_config_path() == temp_dir / ".md2pdf.yaml"
+
+
 def test_init_config_with_existing_file(temp_dir):
     """Test init_config with existing config file."""
     config_path = temp_dir / "md2pdf.yaml"
@@ -229,3 +352,32 @@ def test_processing_config_defaults():
     assert processing_config.retry_backoff == 2.0
     assert processing_config.cpu_threshold == 80
     assert processing_config.memory_limit == 4096
+
+
+def test_cached_enum_converters():
+    """Test memoized enum converters return members and reject bad values."""
+    from md2pdf_pro.config import _to_log_level, _to_pdf_engine
+
+    assert _to_pdf_engine("xelatex") is PdfEngine.XELATEX
+    assert _to_pdf_engine("xelatex") is PdfEngine.XELATEX
+    assert _to_log_level("DEBUG") is LogLevel.DEBUG
+    with pytest.raises(ValueError):
+        _to_pdf_engine("not-an-engine")
+
+
+def test_to_runtime_snapshot():
+    """Test to_runtime builds a frozen copy detached from the model."""
+    import dataclasses
+
+    config = ProjectConfig()
+    config.pandoc.extra_vars["lang"] = "zh"
+    runtime = config.to_runtime()
+
+    assert runtime.pandoc.pdf_engine == config.pandoc.pdf_engine
+    assert runtime.font.cjk_fallback == tuple(config.font.cjk_fallback)
+    assert runtime.output.temp_dir == config.output.temp_dir
+
+    config.pandoc.extra_vars["lang"] = "en"
+    assert runtime.pandoc.extra_vars == {"lang": "zh"}
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        setattr(runtime.pandoc, "toc", True)
@@ -20,6 +20,7 @@ from md2pdf_pro.converter import (
     PandocNotFoundError,
     PandocTimeoutError,
     check_dependencies,
+    probe_command,
 )
 
 
@@ -105,25 +106,94 @@ def test_pandoc_errors():
 
 def test_is_available(mocker, pandoc_engine):
     """Test is_available method."""
+    mocker.patch("shutil.which", return_value="/usr/bin/pandoc")
+
     # Test when pandoc is available
     mocker.patch(
-        "subprocess.run", return_value=type("obj", (object,), {"returncode": 0})
+        "subprocess.run",
+        return_value=type("obj", (object,), {"returncode": 0, "stdout": ""}),
     )
     assert pandoc_engine.is_available()
+    assert pandoc_engine._pandoc_path == "/usr/bin/pandoc"
 
     # Test when pandoc is not available (FileNotFoundError)
     mocker.patch("subprocess.run", side_effect=FileNotFoundError)
+    probe_command.cache_clear()
     pandoc_engine._pandoc_available = None  # Reset cache
     assert not pandoc_engine.is_available()
 
     # Test when pandoc times out
     mocker.patch("subprocess.run", side_effect=subprocess.TimeoutExpired("pandoc", 5))
+    probe_command.cache_clear()
     pandoc_engine._pandoc_available = None  # Reset cache
     assert not pandoc_engine.is_available()
 
 
+def test_is_available_missing_binary_skips_spawn(mocker, pandoc_engine):
+    """Test a binary missing from PATH is never executed."""
+    mocker.patch("shutil.which", return_value=None)
+    run = mocker.patch("subprocess.run")
+
+    assert not pandoc_engine.is_available()
+    run.assert_not_called()
+
+
+def test_probe_command_cached(mocker):
+    """Test probe_command spawns each binary only once."""
+    mocker.patch("shutil.which", return_value="/usr/bin/pandoc")
+    run = mocker.patch(
+        "subprocess.run",
+        return_value=type("obj", (object,), {"returncode": 0, "stdout": "pandoc 3\n"}),
+    )
+
+    for _ in range(3):
+        engine = PandocEngine(PandocConfig())
+        assert engine.is_available()
+        assert engine.version == "pandoc 3"
+
+    assert run.call_count == 1
+
+
+async def test_spawn_uses_resolved_path(mocker, temp_dir):
+    """Test pandoc is launched by absolute path resolved once per process."""
+    which = mocker.patch("shutil.which", return_value="/opt/bin/pandoc")
+    process = mocker.Mock(returncode=0)
+    process.communicate = mocker.AsyncMock(return_value=(b"", b""))
+    spawn = mocker.patch("asyncio.create_subprocess_exec", return_value=process)
+
+    for _ in range(3):
+        engine = PandocEngine(PandocConfig())
+        engine._pandoc_available = True
+        await engine.convert(temp_dir / "in.md", temp_dir / "out.pdf")
+
+    assert which.call_count == 1
+    assert all(call.args[0] == "/opt/bin/pandoc" for call in spawn.call_args_list)
+
+
+async def test_is_available_async_probes_once(mocker, pandoc_engine):
+    """Test concurrent availability checks share a single probe."""
+    import time
+
+    def slow_probe(name):
+        time.sleep(0.05)
+        return "/usr/bin/pandoc", "pandoc 3"
+
+    probe = mocker.patch(
+        "md2pdf_pro.converter.probe_command", side_effect=slow_probe
+    )
+
+    results = await asyncio.gather(
+        *(pandoc_engine._is_available_async() for _ in range(5))
+    )
+
+    assert results == [True] * 5
+    assert probe.call_count == 1
+
+
 def test_version(mocker, pandoc_engine):
     """Test version property."""
+    mocker.patch("shutil.which", return_value="/usr/bin/pandoc")
+
     # Test when pandoc is available
     mock_result = type(
         "obj",
@@ -135,6 +205,7 @@ def test_version(mocker, pandoc_engine):
 
     # Test when pandoc is not available
     mocker.patch("subprocess.run", side_effect=FileNotFoundError)
+    probe_command.cache_clear()
     pandoc_engine._pandoc_version = None  # Reset cache
     assert pandoc_engine.version is None
 
@@ -307,6 +378,101 @@ async def test_convert_generic_error(mocker, pandoc_engine, temp_dir):
     assert result.error_code == -99
 
 
+async def test_convert_bytes(mocker, pandoc_engine):
+    """Test convert_bytes pipes Markdown in and returns PDF bytes."""
+    pandoc_engine._pandoc_available = True
+    process = mocker.Mock(returncode=0)
+    process.communicate = mocker.AsyncMock(return_value=(b"%PDF-1.7", b""))
+    spawn = mocker.patch("asyncio.create_subprocess_exec", return_value=process)
+
+    pdf = await pandoc_engine.convert_bytes(b"# Title", {"title": "T"})
+
+    assert pdf == b"%PDF-1.7"
+    cmd = spawn.call_args.args
+    assert cmd[1:5] == ("-t", "pdf", "-o", "-")
+    assert cmd[-2:] == ("-M", "title=T")
+    process.communicate.assert_awaited_once_with(b"# Title")
+
+
+async def test_convert_bytes_failure(mocker, pandoc_engine):
+    """Test convert_bytes raises ConversionError on a non-zero exit."""
+    pandoc_engine._pandoc_available = True
+    process = mocker.Mock(returncode=43)
+    process.communicate = mocker.AsyncMock(return_value=(b"", b"LaTeX Error"))
+    mocker.patch("asyncio.create_subprocess_exec", return_value=process)
+
+    with pytest.raises(PandocConversionError, match="LaTeX Error"):
+        await pandoc_engine.convert_bytes(b"# Title")
+
+
+async def test_convert_bytes_falls_back_to_files(mocker, pandoc_engine):
+    """Test a pandoc without PDF-to-stdout support is retried with files."""
+    pandoc_engine._pandoc_available = True
+
+    async def fake_exec(*cmd, **kwargs):
+        process = mocker.Mock()
+        if "-" in cmd:
+            process.returncode = 64
+            process.communicate = mocker.AsyncMock(
+                return_value=(b"", b"Unknown output format pdf")
+            )
+        else:
+            Path(cmd[cmd.index("-o") + 1]).write_bytes(b"%PDF-1.4")
+            process.returncode = 0
+            process.communicate = mocker.AsyncMock(return_value=(b"", b""))
+        return process
+
+    spawn = mocker.patch("asyncio.create_subprocess_exec", side_effect=fake_exec)
+
+    assert await pandoc_engine.convert_bytes(b"# Title") == b"%PDF-1.4"
+    assert spawn.call_count == 2
+
+    # Later conversions skip the stdout attempt
+    assert await pandoc_engine.convert_bytes(b"# Again") == b"%PDF-1.4"
+    assert spawn.call_count == 3
+
+
+async def test_convert_many(mocker, pandoc_engine, temp_dir):
+    """Test convert_many passes all inputs to a single pandoc run."""
+    pandoc_engine._pandoc_available = True
+    process = mocker.Mock(returncode=0)
+    process.communicate = mocker.AsyncMock(return_value=(b"", b""))
+    spawn = mocker.patch("asyncio.create_subprocess_exec", return_value=process)
+    inputs = [temp_dir / "01.md", temp_dir / "02.md"]
+    output_file = temp_dir / "book" / "book.pdf"
+
+    result = await pandoc_engine.convert_many(inputs, output_file)
+
+    assert result.success is True
+    assert result.output_path == output_file
+    assert spawn.call_count == 1
+    cmd = spawn.call_args.args
+    assert cmd[1:6] == (
+        str(inputs[0]),
+        str(inputs[1]),
+        "--file-scope",
+        "-o",
+        str(output_file),
+    )
+    assert output_file.parent.is_dir()
+
+
+async def test_convert_duration_uses_perf_counter(mocker, pandoc_engine, temp_dir):
+    """Test conversion time is measured with the monotonic perf counter."""
+    pandoc_engine._pandoc_available = True
+    process = mocker.Mock(returncode=0)
+    process.communicate = mocker.AsyncMock(return_value=(b"", b""))
+    mocker.patch("asyncio.create_subprocess_exec", return_value=process)
+    mocker.patch(
+        "md2pdf_pro.converter.time.perf_counter_ns",
+        side_effect=[1_000_000, 3_500_000],
+    )
+
+    result = await pandoc_engine.convert(temp_dir / "in.md", temp_dir / "out.pdf")
+
+    assert result.duration_ms == 2.5
+
+
 def test_build_args(pandoc_engine, temp_dir):
     """Test _build_args method."""
     input_file = temp_dir / "test.md"
@@ -362,6 +528,25 @@ def test_build_args_with_template(pandoc_engine, temp_dir):
     assert str(template_file) in args
 
 
+def test_build_args_caches_runtime_config(mocker, temp_dir):
+    """Test static arguments are built once for frozen runtime configs."""
+    from md2pdf_pro.config import ProjectConfig
+
+    runtime = ProjectConfig().to_runtime()
+    engine = PandocEngine(runtime.pandoc, runtime.font)
+    font_args = mocker.spy(engine, "_get_font_args")
+
+    first = engine._build_args(temp_dir / "a.md", temp_dir / "a.pdf")
+    second = engine._build_args(
+        temp_dir / "b.md", temp_dir / "b.pdf", {"title": "B"}
+    )
+
+    assert font_args.call_count == 1
+    assert first[3:] == second[3:-2]
+    assert second[:3] == [str(temp_dir / "b.md"), "-o", str(temp_dir / "b.pdf")]
+    assert second[-2:] == ["-M", "title=B"]
+
+
 def test_get_font_args(pandoc_engine):
     """Test _get_font_args method."""
     font_args = pandoc_engine._get_font_args()
@@ -377,15 +562,17 @@ def test_get_font_args(pandoc_engine):
 def test_check_dependencies(mocker):
     """Test check_dependencies function."""
 
+    mocker.patch("shutil.which", side_effect=lambda name: f"/usr/bin/{name}")
+
     # Mock subprocess.run for all dependencies
     def mock_run(cmd, **kwargs):
-        if cmd[0] == "pandoc":
-            return type("obj", (object,), {"returncode": 0})
-        elif cmd[0] == "tectonic":
-            return type("obj", (object,), {"returncode": 0})
-        elif cmd[0] == "xelatex":
-            return type("obj", (object,), {"returncode": 1})
-        return type("obj", (object,), {"returncode": 1})
+        if cmd[0] == "/usr/bin/pandoc":
+            return type("obj", (object,), {"returncode": 0, "stdout": ""})
+        elif cmd[0] == "/usr/bin/tectonic":
+            return type("obj", (object,), {"returncode": 0, "stdout": ""})
+        elif cmd[0] == "/usr/bin/xelatex":
+            return type("obj", (object,), {"returncode": 1, "stdout": ""})
+        return type("obj", (object,), {"returncode": 1, "stdout": ""})
 
     mocker.patch("subprocess.run", side_effect=mock_run)
 
@@ -399,6 +586,7 @@ def test_check_dependencies(mocker):
 def test_check_dependencies_not_found(mocker):
     """Test check_dependencies function when dependencies are not found."""
     # Mock subprocess.run to raise FileNotFoundError for all
+    mocker.patch("shutil.which", side_effect=lambda name: f"/usr/bin/{name}")
     mocker.patch("subprocess.run", side_effect=FileNotFoundError)
 
     deps = check_dependencies()
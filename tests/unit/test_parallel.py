@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import io
 from pathlib import Path
 
 import pytest
@@ -12,6 +13,7 @@ from md2pdf_pro.parallel import (
     BatchProcessor,
     BatchResult,
     ProcessingResult,
+    ResultColumns,
     process_files_parallel,
 )
 
@@ -84,6 +86,28 @@ def test_batch_result():
     assert batch_result.total_duration_ms == 1000.0
 
 
+def test_batch_result_columns():
+    """Test BatchResult built from columns materializes results lazily."""
+    items = [Path("a.md"), Path("b.md"), Path("c.md")]
+    columns = ResultColumns.for_items(items)
+    columns.record(0, ProcessingResult(True, items[0], Path("a.pdf"), None, 5.0))
+    columns.record(1, ProcessingResult(False, items[1], error="boom", duration_ms=2.0))
+    columns.record(2, ProcessingResult(True, items[2], duration_ms=1.0))
+
+    batch_result = BatchResult(
+        total=3, success=columns.success_count, failed=1, skipped=0, columns=columns
+    )
+
+    assert batch_result.success == 2
+    assert batch_result.failed_items == [Path("b.md")]
+    assert batch_result._results is None
+    assert batch_result.results == [
+        ProcessingResult(True, items[0], Path("a.pdf"), None, 5.0),
+        ProcessingResult(False, items[1], None, "boom", 2.0),
+        ProcessingResult(True, items[2], None, None, 1.0),
+    ]
+
+
 def test_batch_result_empty():
     """Test BatchResult with empty results."""
     batch_result = BatchResult(total=0, success=0, failed=0, skipped=0)
@@ -110,6 +134,32 @@ async def test_process_batch_success(test_files):
     assert all(r.success for r in result.results)
 
 
+async def test_process_batch_bounded_workers():
+    """Test process_batch keeps only max_workers items in flight, in order."""
+    items = [Path(f"file{i}.md") for i in range(50)]
+    running = 0
+    peak = 0
+    baseline_tasks = len(asyncio.all_tasks())
+    peak_tasks = 0
+
+    async def process_fn(path: Path) -> Path:
+        nonlocal running, peak, peak_tasks
+        running += 1
+        peak = max(peak, running)
+        peak_tasks = max(peak_tasks, len(asyncio.all_tasks()) - baseline_tasks)
+        await asyncio.sleep(0)
+        running -= 1
+        return path.with_suffix(".pdf")
+
+    processor = BatchProcessor(max_workers=3, show_progress=False)
+    result = await processor.process_batch(items, process_fn)
+
+    assert result.success == 50
+    assert peak == 3
+    assert peak_tasks == 3
+    assert [r.input_path for r in result.results] == items
+
+
 async def test_process_batch_with_failures(test_files):
     """Test process_batch with some failures."""
     processor = BatchProcessor(max_workers=2, show_progress=False)
@@ -304,6 +354,21 @@ def test_adaptive_batch_processor_get_current_workers():
         assert workers == 8
 
 
+def test_adaptive_batch_processor_samples_without_blocking(mocker):
+    """Test _get_current_workers reads CPU usage without a sampling sleep."""
+    psutil = pytest.importorskip("psutil")
+    cpu_percent = mocker.patch.object(psutil, "cpu_percent", return_value=10.0)
+    mocker.patch.object(
+        psutil, "virtual_memory", return_value=mocker.Mock(percent=10.0)
+    )
+
+    processor = AdaptiveBatchProcessor(base_workers=8, show_progress=False)
+    assert processor._get_current_workers() == 8
+
+    assert cpu_percent.call_count == 2
+    assert all(c.kwargs == {"interval": None} for c in cpu_percent.call_args_list)
+
+
 async def test_batch_processor_with_progress_bar(test_files):
     """Test BatchProcessor with progress bar enabled."""
     processor = BatchProcessor(max_workers=2, show_progress=True)
@@ -316,3 +381,32 @@ async def test_batch_processor_with_progress_bar(test_files):
 
     assert result.total == len(test_files)
     assert result.success == len(test_files)
+
+
+async def test_batch_processor_progress_advances_per_item(test_files):
+    """Test the progress bar advances as items finish and stops on cancel."""
+    from rich.console import Console
+
+    processor = BatchProcessor(
+        max_workers=1, show_progress=True, console=Console(file=io.StringIO())
+    )
+    seen: list[float] = []
+
+    async def process_fn(file):
+        assert processor.progress is not None and processor._task_id is not None
+        seen.append(processor.progress.tasks[0].completed)
+        return Path(f"{file.stem}.pdf")
+
+    await processor.process_batch(test_files, process_fn)
+    assert seen == list(range(len(test_files)))
+    assert not processor.progress.live.is_started
+
+    async def hang(file):
+        await asyncio.sleep(10)
+
+    task = asyncio.create_task(processor.process_batch(test_files, hang))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert not processor.progress.live.is_started
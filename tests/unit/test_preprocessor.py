@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import subprocess
+from pathlib import Path
 
 import pytest
 
 from md2pdf_pro.config import MermaidConfig, MermaidFormat, MermaidTheme
+from md2pdf_pro.converter import probe_command
 from md2pdf_pro.preprocessor import (
     MERMAID_PATTERN,
     MermaidError,
@@ -14,7 +16,9 @@ from md2pdf_pro.preprocessor import (
     MermaidPreprocessor,
     MermaidRenderError,
     compute_hash,
+    diagram_digest,
     diagram_line_matches,
+    find_mermaid_blocks,
 )
 
 
@@ -56,6 +60,26 @@ Some text here.
     assert "flowchart TD" in matches[0].group(1)
 
 
+@pytest.mark.parametrize(
+    "content",
+    [
+        "no diagrams here",
+        "```mermaid\ngraph TD\n    A --> B\n```\ntext\n"
+        "```Mermaid  \n\nsequenceDiagram\n```",
+        "````mermaid\ngraph TD\n```",
+        "```mermaid graph TD\n```\n```mermaid\npie\n```",
+        "```mermaid\nunterminated",
+        "```python\nprint()\n```\n```mermaid\r\ngantt\n```",
+    ],
+)
+def test_find_mermaid_blocks_matches_pattern(content):
+    """Test find_mermaid_blocks agrees with MERMAID_PATTERN."""
+    expected = [
+        (m.start(), m.end(), m.group(1)) for m in MERMAID_PATTERN.finditer(content)
+    ]
+    assert [tuple(b) for b in find_mermaid_blocks(content)] == expected
+
+
 def test_compute_hash():
     """Test compute_hash function."""
     content1 = "flowchart TD\n    A --> B"
@@ -66,6 +90,8 @@ def test_compute_hash():
     assert hash1 != hash2
     # Same content should produce same hash
     assert compute_hash(content1) == hash1
+    # Text and its UTF-8 bytes hash the same
+    assert compute_hash(content1.encode("utf-8")) == hash1
 
 
 def test_diagram_line_matches():
@@ -81,23 +107,50 @@ def test_diagram_line_matches():
 
 def test_is_available(mocker, preprocessor):
     """Test is_available method."""
+    mocker.patch("shutil.which", return_value="/usr/local/bin/mmdc")
+
     # Test when mmdc is available
     mocker.patch(
-        "subprocess.run", return_value=type("obj", (object,), {"returncode": 0})
+        "subprocess.run",
+        return_value=type("obj", (object,), {"returncode": 0, "stdout": ""}),
     )
     assert preprocessor.is_available()
+    assert preprocessor._build_command(Path("in.mmd"), Path("out.pdf"))[0] == (
+        "/usr/local/bin/mmdc"
+    )
 
     # Test when mmdc is not available (FileNotFoundError)
     mocker.patch("subprocess.run", side_effect=FileNotFoundError)
+    probe_command.cache_clear()
     preprocessor._mmdc_available = None  # Reset cache
     assert not preprocessor.is_available()
 
     # Test when mmdc times out
     mocker.patch("subprocess.run", side_effect=subprocess.TimeoutExpired("mmdc", 5))
+    probe_command.cache_clear()
     preprocessor._mmdc_available = None  # Reset cache
     assert not preprocessor.is_available()
 
 
+async def test_is_available_async_probes_in_thread(mocker, preprocessor):
+    """Test the async availability check probes off the event loop once."""
+    import threading
+
+    main_thread = threading.get_ident()
+    probe_threads = []
+
+    def fake_probe(name):
+        probe_threads.append(threading.get_ident())
+        return "/usr/local/bin/mmdc", "11.0.0"
+
+    mocker.patch("md2pdf_pro.preprocessor.probe_command", side_effect=fake_probe)
+
+    assert await preprocessor._is_available_async()
+    assert await preprocessor._is_available_async()
+    assert len(probe_threads) == 1
+    assert probe_threads[0] != main_thread
+
+
 async def test_process_no_mermaid(preprocessor):
     """Test process method with no Mermaid code blocks."""
     content = "# Test\n\nSome text here."
@@ -194,15 +247,12 @@ async def test_process_render_error(mocker, preprocessor):
     # Mock is_available to return True
     preprocessor._mmdc_available = True
 
-    # Mock subprocess.run to simulate error
-    mocker.patch(
-        "subprocess.run",
-        return_value=type(
-            "obj",
-            (object,),
-            {"returncode": 1, "stderr": "Error: Invalid Mermaid code", "stdout": ""},
-        ),
+    # Mock the mmdc subprocess to simulate error
+    process = mocker.Mock(returncode=1)
+    process.communicate = mocker.AsyncMock(
+        return_value=(b"", b"Error: Invalid Mermaid code")
     )
+    mocker.patch("asyncio.create_subprocess_exec", return_value=process)
 
     test_content = """# Test
 
@@ -223,13 +273,10 @@ async def test_process_output_not_created(mocker, preprocessor):
     # Mock is_available to return True
     preprocessor._mmdc_available = True
 
-    # Mock subprocess.run to return success but not create file
-    mocker.patch(
-        "subprocess.run",
-        return_value=type(
-            "obj", (object,), {"returncode": 0, "stderr": "", "stdout": ""}
-        ),
-    )
+    # Mock the mmdc subprocess to return success but not create file
+    process = mocker.Mock(returncode=0)
+    process.communicate = mocker.AsyncMock(return_value=(b"", b""))
+    mocker.patch("asyncio.create_subprocess_exec", return_value=process)
 
     test_content = """# Test
 
@@ -246,6 +293,248 @@ flowchart TD
     assert len(files) == 0
 
 
+async def test_process_document_cache(mocker, preprocessor):
+    """Test processed documents are cached until a diagram disappears."""
+    preprocessor._mmdc_available = True
+
+    async def fake_render(code, output_path):
+        output_path.write_text("diagram", encoding="utf-8")
+
+    mock_render = mocker.patch.object(
+        preprocessor, "_render_mermaid", side_effect=fake_render
+    )
+
+    test_content = """# Test
+
+```mermaid
+flowchart TD
+    A[Start] --> B{Decision}
+```
+"""
+
+    result, files = await preprocessor.process(test_content, "test_file")
+    assert mock_render.call_count == 1
+    assert len(list(preprocessor.output_dir.glob("*.cache"))) == 1
+
+    # Cache hit returns the same result without touching the diagrams
+    mocker.patch(
+        "md2pdf_pro.preprocessor.diagram_digest", side_effect=AssertionError
+    )
+    assert await preprocessor.process(test_content, "test_file") == (result, files)
+
+    # A missing diagram invalidates the cached document
+    mocker.stopall()
+    mock_render = mocker.patch.object(
+        preprocessor, "_render_mermaid", side_effect=fake_render
+    )
+    files[0].unlink()
+    assert await preprocessor.process(test_content, "test_file") == (result, files)
+    assert mock_render.call_count == 1
+
+    # A new version of the document replaces the entry instead of adding one
+    new_content = test_content.replace("Start", "Begin")
+    new_result, _ = await preprocessor.process(new_content, "test_file")
+    assert mock_render.call_count == 2
+    assert len(list(preprocessor.output_dir.glob("*.cache"))) == 1
+    assert await preprocessor.process(new_content, "test_file") == (
+        new_result,
+        mocker.ANY,
+    )
+    assert mock_render.call_count == 2
+
+
+async def test_process_batch_renders_once(mocker, preprocessor):
+    """Test several uncached diagrams are rendered by a single mmdc run."""
+    preprocessor._mmdc_available = True
+    single = mocker.patch.object(preprocessor, "_render_mermaid")
+
+    async def fake_exec(*cmd, **kwargs):
+        out = Path(cmd[cmd.index("-o") + 1])
+        ext = cmd[cmd.index("-e") + 1]
+        for number in (1, 2):
+            out.with_name(f"out-{number}.{ext}").write_text("pdf", encoding="utf-8")
+        process = mocker.Mock(returncode=0)
+        process.communicate = mocker.AsyncMock(return_value=(b"", b""))
+        return process
+
+    spawn = mocker.patch("asyncio.create_subprocess_exec", side_effect=fake_exec)
+
+    test_content = """```mermaid
+graph TD
+    A --> B
+```
+
+```mermaid
+graph TD
+    C --> D
+```
+"""
+
+    result, files = await preprocessor.process(test_content, "doc")
+
+    assert spawn.call_count == 1
+    single.assert_not_called()
+    assert len(files) == 2
+    assert all(f.read_text(encoding="utf-8") == "pdf" for f in files)
+    assert "```mermaid" not in result
+
+
+async def test_process_many_diagrams_lists_cache_once(mocker, preprocessor):
+    """Test documents with many diagrams check the cache by one listing."""
+    from md2pdf_pro.preprocessor import _LISTDIR_MIN_BLOCKS
+
+    count = _LISTDIR_MIN_BLOCKS + 2
+    codes = [f"graph TD\n    A{i} --> B" for i in range(count)]
+    content = "\n".join(f"```mermaid\n{code}\n```" for code in codes)
+
+    # Pre-render every other diagram (block code keeps its trailing newline)
+    digests = [
+        diagram_digest(f"{code}\n".encode(), preprocessor.config) for code in codes
+    ]
+    names = [f"{digest}.pdf" for digest in digests]
+    for name in names[::2]:
+        (preprocessor.output_dir / name).write_text("pdf", encoding="utf-8")
+
+    batch = mocker.patch.object(preprocessor, "_render_mermaid_batch")
+    mocker.patch.object(preprocessor, "_render_mermaid")
+    preprocessor._mmdc_available = True
+    exists = mocker.spy(Path, "exists")
+
+    await preprocessor.process(content, "doc")
+
+    rendered = batch.call_args.args[0]
+    assert [p.name for _, p in rendered] == names[1::2]
+    # Only the post-batch re-check of the missing diagrams stats files
+    assert exists.call_count == len(rendered)
+
+
+async def test_process_shares_diagrams_across_documents(mocker, preprocessor):
+    """Test identical diagrams are rendered once regardless of the document."""
+    preprocessor._mmdc_available = True
+
+    async def fake_render(code, output_path):
+        output_path.write_text("diagram", encoding="utf-8")
+
+    render = mocker.patch.object(
+        preprocessor, "_render_mermaid", side_effect=fake_render
+    )
+    content = "```mermaid\ngraph TD\n    A --> B\n```\n"
+
+    _, files_a = await preprocessor.process(content + "\n" + content, "a")
+    _, files_b = await preprocessor.process(content, "b")
+
+    assert render.call_count == 1
+    assert files_a == [files_b[0], files_b[0]]
+
+
+def test_diagram_digest_covers_config(mermaid_config):
+    """Test render options are part of the diagram content address."""
+    code = b"graph TD\n    A --> B\n"
+    digest = diagram_digest(code, mermaid_config)
+    assert len(digest) == 32
+    assert diagram_digest(code, mermaid_config) == digest
+
+    for field, value in (
+        ("theme", MermaidTheme.DARK),
+        ("width", 800),
+        ("background", "transparent"),
+        ("format", MermaidFormat.SVG),
+    ):
+        changed = mermaid_config.model_copy(update={field: value})
+        assert diagram_digest(code, changed) != digest
+
+
+async def test_process_keeps_failed_blocks(mocker, preprocessor):
+    """Test diagrams render concurrently and only failed blocks stay as code."""
+    from md2pdf_pro.errors import ErrorCode
+
+    preprocessor._mmdc_available = True
+    mocker.patch.object(
+        preprocessor,
+        "_render_mermaid_batch",
+        side_effect=MermaidError("batch failed", ErrorCode.MERMAID_RENDER_ERROR),
+    )
+
+    async def fake_render(code, output_path):
+        if b"bad" in code:
+            raise MermaidError("bad diagram", ErrorCode.MERMAID_RENDER_ERROR)
+        output_path.write_text("diagram", encoding="utf-8")
+
+    render = mocker.patch.object(
+        preprocessor, "_render_mermaid", side_effect=fake_render
+    )
+
+    test_content = "intro\n```mermaid\nbad\n```\nmiddle\n```mermaid\ngraph TD\n```\nend"
+
+    result, files = await preprocessor.process(test_content, "doc")
+
+    assert render.call_count == 2
+    assert len(files) == 1
+    assert result.startswith("intro\n```mermaid\nbad\n```\nmiddle\n")
+    assert "\\includegraphics" in result
+    assert result.endswith("\nend")
+    assert not list(preprocessor.output_dir.glob("*.cache"))
+
+
+async def test_render_mermaid_bounded_concurrency(mocker, mermaid_config, temp_dir):
+    """Test concurrent mmdc runs are capped by max_concurrent."""
+    import asyncio
+
+    mermaid_config.output_dir = temp_dir / "mermaid_cache"
+    mermaid_config.max_concurrent = 2
+    preprocessor = MermaidPreprocessor(mermaid_config)
+    preprocessor._mmdc_available = True
+    running = 0
+    peak = 0
+
+    async def communicate(input_data=None):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return b"", b""
+
+    async def fake_exec(*cmd, **kwargs):
+        Path(cmd[cmd.index("-o") + 1]).write_text("pdf", encoding="utf-8")
+        return mocker.Mock(returncode=0, communicate=communicate)
+
+    mocker.patch("asyncio.create_subprocess_exec", side_effect=fake_exec)
+
+    out_dir = preprocessor.output_dir
+    await asyncio.gather(
+        *(
+            preprocessor._render_mermaid("graph TD", out_dir / f"{i}.pdf")
+            for i in range(5)
+        )
+    )
+
+    assert peak == 2
+
+
+async def test_render_mermaid_uses_stdin(mocker, preprocessor):
+    """Test diagram code is piped to mmdc instead of a temporary file."""
+    preprocessor._mmdc_available = True
+    output_path = preprocessor.output_dir / "diagram.pdf"
+
+    process = mocker.Mock(returncode=0)
+
+    async def communicate(input_data=None):
+        output_path.write_text("pdf", encoding="utf-8")
+        return b"", b""
+
+    process.communicate = mocker.AsyncMock(side_effect=communicate)
+    spawn = mocker.patch("asyncio.create_subprocess_exec", return_value=process)
+    temp = mocker.patch("tempfile.NamedTemporaryFile")
+
+    await preprocessor._render_mermaid("graph TD\n    A --> B", output_path)
+
+    cmd = spawn.call_args.args
+    assert cmd[cmd.index("-i") + 1] == "-"
+    process.communicate.assert_awaited_once_with(b"graph TD\n    A --> B")
+    temp.assert_not_called()
+
+
 def test_clear_cache(preprocessor, temp_dir):
     """Test clear_cache method."""
     # Create some test files in the cache directory
@@ -270,7 +559,7 @@ def test_build_command(preprocessor, temp_dir):
 
     cmd = preprocessor._build_command(input_path, output_path)
 
-    assert cmd[0] == "mmdc"
+    assert Path(cmd[0]).stem == "mmdc"
     assert "-i" in cmd
     assert str(input_path) in cmd
     assert "-o" in cmd
@@ -106,6 +106,107 @@ def test_markdown_event_handler():
     assert len(captured_changes) == 0
 
 
+def test_markdown_event_handler_suffixes():
+    """Test Markdown suffixes are matched case-insensitively."""
+    captured_changes = []
+    handler = MarkdownEventHandler(captured_changes.append)
+
+    class MockEvent:
+        def __init__(self, src_path):
+            self.src_path = src_path
+            self.is_directory = False
+
+    for name in ("a.md", "b.MD", "c.markdown", "d.Markdown", "e.mdx", "f.txt"):
+        handler.on_modified(MockEvent(name))
+
+    assert [c.path.name for c in captured_changes] == [
+        "a.md",
+        "b.MD",
+        "c.markdown",
+        "d.Markdown",
+    ]
+
+
+async def test_file_watcher_coalesces_create_storms(mocker, test_dir):
+    """Test a create and modify storm fires once, after the last event."""
+    import time
+
+    observer_cls = mocker.patch("md2pdf_pro.watcher.Observer")
+    fired: list[tuple[float, list[Path]]] = []
+    watcher = FileWatcher(
+        test_dir,
+        lambda files: fired.append((time.monotonic(), files)),
+        debounce_ms=100,
+    )
+    watcher.start()
+    handler = observer_cls.return_value.schedule.call_args.args[0]
+
+    class MockEvent:
+        def __init__(self, src_path):
+            self.src_path = src_path
+            self.is_directory = False
+
+    src = str(test_dir / "test1.md")
+    try:
+        handler.on_created(MockEvent(src))
+        # Keep writing for longer than the debounce window
+        for _ in range(10):
+            await asyncio.sleep(0.03)
+            handler.on_modified(MockEvent(src))
+        last_event = time.monotonic()
+        await asyncio.sleep(0.3)
+    finally:
+        watcher.stop()
+
+    assert [files for _, files in fired] == [[(test_dir / "test1.md").resolve()]]
+    assert fired[0][0] >= last_event + 0.09
+
+
+def test_markdown_event_handler_memoizes_filter():
+    """Test repeated events for one path reuse the filter result."""
+    captured_changes = []
+    handler = MarkdownEventHandler(captured_changes.append)
+
+    class MockEvent:
+        def __init__(self, src_path):
+            self.src_path = src_path
+            self.is_directory = False
+
+    for _ in range(4):
+        handler.on_modified(MockEvent("notes.md"))
+        handler.on_modified(MockEvent(".git/index"))
+
+    assert len(captured_changes) == 4
+    assert handler._passes.cache_info().misses == 2
+
+
+def test_markdown_path_filters_without_path_objects(mocker):
+    """Test rejected events are filtered before any Path is built."""
+    handler = MarkdownEventHandler(lambda x: None)
+    path_cls = mocker.patch("md2pdf_pro.watcher.Path")
+
+    assert handler._markdown_path("/repo/.git/index") is None
+    assert handler._markdown_path("/repo/docs/_draft.md") is None
+    assert handler._markdown_path("/repo/docs/image.png") is None
+    assert handler._markdown_path("/repo/docs/.md") is None
+    path_cls.assert_not_called()
+
+    handler._markdown_path(b"/repo/docs/guide.md")
+    path_cls.assert_called_once_with("/repo/docs/guide.md")
+
+
+def test_should_ignore_overlapping_suffixes():
+    """Test suffix lookup agrees with endswith for overlapping patterns."""
+    suffixes = ["~", ".swp", "p", ".tmp", "mp", ".bak", "b.bak", "a"]
+    handler = MarkdownEventHandler(
+        lambda x: None, ignore_patterns=[f"*{suffix}" for suffix in suffixes]
+    )
+
+    for name in ("x.swp", "x.tmp", "notes.md", "x~", "a.bak", "ab", "data", "amp"):
+        expected = any(name.endswith(suffix) for suffix in suffixes)
+        assert handler._should_ignore(Path(name)) is expected, name
+
+
 def test_should_ignore():
     """Test _should_ignore method."""
     handler = MarkdownEventHandler(
@@ -122,6 +223,32 @@ def test_should_ignore():
     assert not handler._should_ignore(Path("test.md"))
 
 
+@pytest.mark.parametrize(
+    ("name", "ignored"),
+    [
+        (".git", True),
+        ("_build", True),
+        ("notes.bak", True),
+        ("notes.md", False),
+        ("node_modules", True),
+        ("node_modules2", False),
+        (".cache-dir", True),
+        ("a.b.bak.md", False),
+        ("line\nbreak.bak", True),
+        (".bak", True),
+        ("bak", False),
+    ],
+)
+def test_should_ignore_pattern_kinds(name, ignored):
+    """Test exact, prefix and suffix ignore patterns."""
+    handler = MarkdownEventHandler(
+        lambda x: None,
+        ignore_patterns=[".*", "_*", "*.bak", ".cache", "node_modules"],
+    )
+
+    assert handler._should_ignore(Path(name)) is ignored
+
+
 async def test_file_watcher_start_stop(test_dir):
     """Test FileWatcher start and stop."""
     captured_files = []
@@ -140,6 +267,37 @@ async def test_file_watcher_start_stop(test_dir):
     assert not watcher.is_running()
 
 
+def test_file_watcher_narrows_event_filter(mocker, test_dir):
+    """Test the observer is scheduled only for the handled event types."""
+    from watchdog.events import FileClosedEvent, FileModifiedEvent, FileOpenedEvent
+
+    observer_cls = mocker.patch("md2pdf_pro.watcher.Observer")
+    watcher = FileWatcher(test_dir, lambda files: None)
+    watcher.start()
+    watcher.stop()
+
+    event_filter = observer_cls.return_value.schedule.call_args.kwargs["event_filter"]
+    assert FileModifiedEvent in event_filter
+    assert FileOpenedEvent not in event_filter
+    assert FileClosedEvent not in event_filter
+
+
+def test_file_watcher_single_file(mocker, test_dir):
+    """Test a file is watched via its directory, without recursion."""
+    observer_cls = mocker.patch("md2pdf_pro.watcher.Observer")
+    target = test_dir / "test1.md"
+    watcher = FileWatcher(target, lambda files: None)
+    watcher.start()
+    watcher.stop()
+
+    schedule = observer_cls.return_value.schedule
+    handler, watch_dir = schedule.call_args.args
+    assert watch_dir == str(test_dir)
+    assert schedule.call_args.kwargs["recursive"] is False
+    assert handler._markdown_path(str(target)) == target
+    assert handler._markdown_path(str(test_dir / "test2.md")) is None
+
+
 async def test_file_watcher_debouncing(test_dir):
     """Test FileWatcher debouncing."""
     captured_files = []
@@ -172,6 +330,34 @@ async def test_file_watcher_debouncing(test_dir):
         watcher.stop()
 
 
+async def test_file_watcher_single_timer_thread(test_dir):
+    """Test bursts of events share one timer thread and fire one batch."""
+    import threading
+
+    batches = []
+    watcher = FileWatcher(test_dir, batches.append, debounce_ms=30)
+    watcher.start()
+
+    try:
+        threads = threading.active_count()
+        for _ in range(50):
+            for name in ("test1.md", "test2.md"):
+                watcher._handle_change(
+                    FileChange("modified", test_dir / name, is_directory=False)
+                )
+        assert threading.active_count() == threads
+
+        await asyncio.sleep(0.2)
+        # Both paths expire in the same tick and arrive in one callback
+        assert [sorted(p.name for p in batch) for batch in batches] == [
+            ["test1.md", "test2.md"]
+        ]
+    finally:
+        watcher.stop()
+
+    assert watcher._debounce_thread is None
+
+
 def test_watch_manager():
     """Test WatchManager."""
     manager = WatchManager()
@@ -199,6 +385,114 @@ def test_watch_manager():
     assert len(manager.watchers) == 0
 
 
+def test_watch_manager_subsumes_nested_watches(mocker, test_dir):
+    """Test covered nested watches stay registered but are not started."""
+    mocker.patch("md2pdf_pro.watcher.Observer")
+    manager = WatchManager()
+    subdir = (test_dir / "subdir").resolve()
+    root = test_dir.resolve()
+
+    def callback(files):
+        pass
+
+    def other_callback(files):
+        pass
+
+    try:
+        # Nested watch added first is paused by the recursive parent
+        manager.add_watch(subdir, callback)
+        assert manager.watchers[subdir].is_running()
+        manager.add_watch(test_dir, callback)
+        assert set(manager.watchers) == {root, subdir}
+        assert manager.watchers[root].is_running()
+        assert not manager.watchers[subdir].is_running()
+
+        # Removing the cover resumes the nested watch
+        manager.remove_watch(test_dir)
+        assert manager.watchers[subdir].is_running()
+
+        # Covered when added under a running parent
+        manager.add_watch(test_dir, callback)
+        assert not manager.watchers[subdir].is_running()
+        manager.remove_watch(subdir)
+        assert list(manager.watchers) == [root]
+
+        # Different settings still need their own watch
+        manager.add_watch(subdir, other_callback)
+        assert manager.watchers[subdir].is_running()
+        manager.remove_watch(subdir)
+        manager.add_watch(subdir, callback, debounce_ms=100)
+        assert manager.watchers[subdir].is_running()
+        manager.remove_watch(subdir)
+        manager.add_watch(subdir, callback, ignore_patterns=[".*"])
+        assert manager.watchers[subdir].is_running()
+
+        manager.remove_watch(test_dir)
+        manager.remove_watch(subdir)
+        assert manager.watchers == {}
+        assert manager._root.children == {}
+    finally:
+        manager.remove_all()
+
+
+async def test_watch_manager_resumes_child_after_parent_removed(test_dir):
+    """Test a covered watch fires once its cover is removed."""
+    captured_files = []
+    manager = WatchManager()
+
+    try:
+        manager.add_watch(test_dir, captured_files.extend, debounce_ms=50)
+        manager.add_watch(test_dir / "subdir", captured_files.extend, debounce_ms=50)
+        manager.remove_watch(test_dir)
+
+        test_file = test_dir / "subdir" / "test3.md"
+        test_file.write_text("# Updated", encoding="utf-8")
+        await asyncio.sleep(0.3)
+
+        assert any(
+            captured.resolve() == test_file.resolve() for captured in captured_files
+        )
+    finally:
+        manager.remove_all()
+
+
+def test_watch_manager_caches_resolution(mocker, test_dir):
+    """Test each input path is resolved only once."""
+    mocker.patch("md2pdf_pro.watcher.Observer")
+    manager = WatchManager()
+    resolve = mocker.spy(Path, "resolve")
+
+    try:
+        for _ in range(3):
+            manager.add_watch(test_dir, lambda files: None)
+            manager.remove_watch(test_dir)
+    finally:
+        manager.remove_all()
+
+    assert [call.args[0] for call in resolve.call_args_list].count(test_dir) == 1
+
+
+def test_watch_manager_resolves_relative_paths_per_cwd(mocker, test_dir, monkeypatch):
+    """Test a relative path follows the current working directory."""
+    mocker.patch("md2pdf_pro.watcher.Observer")
+    manager = WatchManager()
+
+    try:
+        monkeypatch.chdir(test_dir)
+        manager.add_watch(Path("."), lambda files: None)
+        monkeypatch.chdir(test_dir / "subdir")
+        manager.add_watch(Path("."), lambda files: None)
+        assert set(manager.watchers) == {
+            test_dir.resolve(),
+            (test_dir / "subdir").resolve(),
+        }
+
+        manager.remove_watch(Path("."))
+        assert list(manager.watchers) == [test_dir.resolve()]
+    finally:
+        manager.remove_all()
+
+
 def test_get_watch_manager():
     """Test get_watch_manager function."""
     manager1 = get_watch_manager()
@@ -242,6 +536,113 @@ async def test_watch_and_convert(test_dir):
             pass
 
 
+async def test_watch_and_convert_runs_on_event_loop(mocker):
+    """Test changes from the watcher thread are converted on the caller's loop."""
+    import threading
+
+    manager = mocker.patch("md2pdf_pro.watcher.get_watch_manager").return_value
+    loop = asyncio.get_running_loop()
+    converted = []
+    done = asyncio.Event()
+
+    async def convert_fn(file):
+        assert asyncio.get_running_loop() is loop
+        converted.append(file)
+        if len(converted) == 3:
+            done.set()
+
+    watch_task = asyncio.create_task(watch_and_convert(Path("."), convert_fn))
+    await asyncio.sleep(0)
+    on_change = manager.add_watch.call_args.args[1]
+
+    def burst():
+        for name in ("a.md", "b.md", "c.md"):
+            on_change([Path(name)])
+
+    thread = threading.Thread(target=burst)
+    thread.start()
+    thread.join()
+
+    try:
+        await asyncio.wait_for(done.wait(), timeout=1)
+        assert sorted(p.name for p in converted) == ["a.md", "b.md", "c.md"]
+    finally:
+        watch_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await watch_task
+
+
+async def test_watch_and_convert_bounded_concurrency(mocker):
+    """Test a burst is converted concurrently up to max_workers."""
+    manager = mocker.patch("md2pdf_pro.watcher.get_watch_manager").return_value
+    active = 0
+    peak = 0
+    converted = []
+    done = asyncio.Event()
+
+    async def convert_fn(file):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        converted.append(file)
+        if len(converted) == 6:
+            done.set()
+
+    watch_task = asyncio.create_task(
+        watch_and_convert(Path("."), convert_fn, max_workers=2)
+    )
+    await asyncio.sleep(0)
+    on_change = manager.add_watch.call_args.args[1]
+    on_change([Path(f"{i}.md") for i in range(6)])
+
+    try:
+        await asyncio.wait_for(done.wait(), timeout=1)
+        assert peak == 2
+    finally:
+        watch_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await watch_task
+
+
+async def test_watch_and_convert_single_worker(mocker):
+    """Test changes during a conversion wait for the running batch."""
+    manager = mocker.patch("md2pdf_pro.watcher.get_watch_manager").return_value
+    release = asyncio.Event()
+    in_flight = 0
+    calls = []
+
+    async def convert_fn(file):
+        nonlocal in_flight
+        in_flight += 1
+        assert in_flight == 1
+        calls.append(file)
+        await release.wait()
+        in_flight -= 1
+
+    watch_task = asyncio.create_task(watch_and_convert(Path("."), convert_fn))
+    await asyncio.sleep(0)
+    on_change = manager.add_watch.call_args.args[1]
+
+    try:
+        on_change([Path("a.md")])
+        await asyncio.sleep(0.01)
+        on_change([Path("a.md")])
+        on_change([Path("a.md")])
+        await asyncio.sleep(0.01)
+        assert calls == [Path("a.md")]
+
+        # The queued changes collapse into one follow-up conversion
+        release.set()
+        await asyncio.sleep(0.01)
+        assert calls == [Path("a.md"), Path("a.md")]
+    finally:
+        watch_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await watch_task
+
+
 async def test_file_watcher_edge_cases(test_dir):
     """Test FileWatcher edge cases."""
     captured_files = []